@@ -1,6 +1,7 @@
 import os
+import gzip
 from datetime import timedelta
-from flask import Flask, jsonify
+from flask import Flask, jsonify, request
 from flask_cors import CORS
 from dotenv import load_dotenv
 from .config import Config
@@ -104,6 +105,32 @@ def create_app(config_class: type = Config) -> Flask:
             pass
         return response
 
+    # Gzip large text responses (home HTML, sitemap, JSON lists) when the client accepts it
+    @app.after_request
+    def compress_response(response):
+        try:
+            if app.config.get("COMPRESS_ENABLED", "1") not in ("1", "true", "True"):
+                return response
+            if response.direct_passthrough or response.is_streamed:
+                return response
+            if response.status_code < 200 or response.status_code >= 300:
+                return response
+            if "Content-Encoding" in response.headers:
+                return response
+            if response.mimetype not in app.config.get("COMPRESS_MIMETYPES", []):
+                return response
+            if "gzip" not in request.headers.get("Accept-Encoding", "").lower():
+                return response
+            data = response.get_data()
+            if len(data) < int(app.config.get("COMPRESS_MIN_SIZE", 500)):
+                return response
+            response.set_data(gzip.compress(data, compresslevel=int(app.config.get("COMPRESS_LEVEL", 5))))
+            response.headers["Content-Encoding"] = "gzip"
+            response.vary.add("Accept-Encoding")
+        except Exception as e:
+            app.logger.debug(f"Response compression skipped: {e}")
+        return response
+
     # Auto-create tables in dev (SQLite fallback) to keep onboarding simple
     with app.app_context():
         try:
@@ -681,17 +681,21 @@ def fees_detail(pool_id: int):
         fb = Decimal(pool.fee_accum_b or 0)
         def allocs(bps: int):
             return {"A": (fa * Decimal(bps) / Decimal(10000)), "B": (fb * Decimal(bps) / Decimal(10000))}
-        def paid(entity: str):
-            rows = FeePayout.query.filter_by(pool_id=pool.id, entity=entity).all()
-            totA = Decimal("0"); totB = Decimal("0")
-            for p in rows:
-                if p.asset == "A": totA += Decimal(p.amount or 0)
-                elif p.asset == "B": totB += Decimal(p.amount or 0)
-            return {"A": totA, "B": totB}
+        # Paid totals for every entity/asset in one grouped aggregate
+        paid = {entity: {"A": Decimal("0"), "B": Decimal("0")} for entity in ("creator", "minter", "treasury")}
+        rows = (
+            db.session.query(FeePayout.entity, FeePayout.asset, func.coalesce(func.sum(FeePayout.amount), 0))
+            .filter(FeePayout.pool_id == pool.id)
+            .group_by(FeePayout.entity, FeePayout.asset)
+            .all()
+        )
+        for entity, asset, total in rows:
+            if entity in paid and asset in ("A", "B"):
+                paid[entity][asset] = Decimal(str(total or 0))
         out = {}
         for entity, bps in (("creator", bps_c), ("minter", bps_m), ("treasury", bps_t)):
             a = allocs(bps)
-            p = paid(entity)
+            p = paid[entity]
             out[entity] = {
                 "alloc": {"A": float(a["A"]), "B": float(a["B"])},
                 "paid": {"A": float(p["A"]), "B": float(p["B"])},
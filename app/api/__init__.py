@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from flask import Blueprint, jsonify, abort, request, g, current_app
+from flask import Blueprint, Response, jsonify, abort, request, g, current_app
 from ..models import (
     Token,
     TokenInfo,
@@ -20,8 +20,11 @@ from datetime import datetime, timedelta
 from sqlalchemy.exc import IntegrityError
 import re
 from urllib.parse import urlparse
+
+import orjson
 from decimal import Decimal
 from ..services.amm import quote_swap, execute_swap
+from ..services.events import notify
 from sqlalchemy import case, func
 # TODO: _get_or_create_balance uses AccountBalance which has been removed
 # from ..services.reconcile import reconcile_invoices_once, reconcile_withdrawals_once, _get_or_create_balance
@@ -997,6 +1000,23 @@ def lightning_deposit_create():
     return jsonify(inv.to_dict()), 201
 
 
+# Columns selected for the invoice list endpoint (mirrors LightningInvoice.to_dict)
+_INVOICE_FIELDS = (
+    "id",
+    "user_id",
+    "amount_sats",
+    "memo",
+    "payment_request",
+    "payment_hash",
+    "status",
+    "credited",
+    "expires_at",
+    "paid_at",
+    "created_at",
+)
+_INVOICE_COLUMNS = tuple(getattr(LightningInvoice, f) for f in _INVOICE_FIELDS)
+
+
 @api_bp.get("/lightning/invoices")
 @require_auth
 def lightning_invoices_list():
@@ -1006,16 +1026,21 @@ def lightning_invoices_list():
         return jsonify({"error": "user_not_found"}), 404
 
     try:
-        invoices = (
+        rows = (
             LightningInvoice.query
             .filter_by(user_id=user.id)
             .order_by(LightningInvoice.created_at.desc())
+            .with_entities(*_INVOICE_COLUMNS)
             .all()
         )
 
-        return jsonify({
-            "invoices": [invoice.to_dict() for invoice in invoices]
-        })
+        # Serialize column tuples directly; same shape as LightningInvoice.to_dict()
+        invoices = [dict(zip(_INVOICE_FIELDS, row)) for row in rows]
+        body = orjson.dumps(
+            {"invoices": invoices},
+            option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z,
+        )
+        return Response(body, mimetype="application/json")
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -1479,11 +1504,12 @@ def amm_swap():
             max_slippage_bps=int(max_slippage_bps) if max_slippage_bps is not None else None,
         )
         db.session.commit()
-        # Invalidate hot caches affected by trades
+        # Wake SSE streams waiting on new trades (and any stage burns they caused)
+        notify("trades")
+        # Invalidate hot caches affected by trades (throttled)
         try:
-            from ..web import _cached_trending_items, _cached_stats
-            cache.delete_memoized(_cached_trending_items)
-            cache.delete_memoized(_cached_stats)
+            from ..web.tokens.routes import _invalidate_trade_caches
+            _invalidate_trade_caches()
         except Exception:
             pass
         return jsonify({
@@ -1718,22 +1744,22 @@ def _fees_summary_for_pool(pool: SwapPool, rule: FeeDistributionRule | None) ->
             "A": (fa * Decimal(bps) / Decimal(10000)),
             "B": (fb * Decimal(bps) / Decimal(10000)),
         }
-    # Totals paid so far from payouts table
-    def paid(entity: str):
-        rows = FeePayout.query.filter_by(pool_id=pool.id, entity=entity).all()
-        totA = Decimal("0")
-        totB = Decimal("0")
-        for p in rows:
-            if p.asset == "A":
-                totA += Decimal(p.amount or 0)
-            elif p.asset == "B":
-                totB += Decimal(p.amount or 0)
-        return {"A": totA, "B": totB}
+    # Totals paid so far from payouts table, every entity/asset in one grouped aggregate
+    paid = {entity: {"A": Decimal("0"), "B": Decimal("0")} for entity in ("creator", "minter", "treasury")}
+    rows = (
+        db.session.query(FeePayout.entity, FeePayout.asset, func.coalesce(func.sum(FeePayout.amount), 0))
+        .filter(FeePayout.pool_id == pool.id)
+        .group_by(FeePayout.entity, FeePayout.asset)
+        .all()
+    )
+    for entity, asset, total in rows:
+        if entity in paid and asset in ("A", "B"):
+            paid[entity][asset] = Decimal(str(total or 0))
 
     out = {}
     for entity, bps in (("creator", bps_c), ("minter", bps_m), ("treasury", bps_t)):
         a = allocs(bps)
-        p = paid(entity)
+        p = paid[entity]
         out[entity] = {
             "alloc": {"A": float(a["A"]), "B": float(a["B"])},
             "paid": {"A": float(p["A"]), "B": float(p["B"])},
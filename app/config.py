@@ -91,6 +91,21 @@ class Config:
     OP_ALERTS_MIN_SUCCESS_15M = float(os.getenv("OP_ALERTS_MIN_SUCCESS_15M", "0.8"))  # fraction
     OP_ALERTS_INVARIANT_TOL_SATS = int(os.getenv("OP_ALERTS_INVARIANT_TOL_SATS", "0"))
 
+    # Response compression (gzip for large HTML/XML/JSON bodies)
+    COMPRESS_ENABLED = os.getenv("COMPRESS_ENABLED", "1")
+    COMPRESS_MIMETYPES = [
+        m.strip()
+        for m in os.getenv(
+            "COMPRESS_MIMETYPES", "text/html,application/xml,text/plain,application/json"
+        ).split(",")
+        if m.strip()
+    ]
+    COMPRESS_LEVEL = int(os.getenv("COMPRESS_LEVEL", "5"))
+    COMPRESS_MIN_SIZE = int(os.getenv("COMPRESS_MIN_SIZE", "500"))  # bytes
+
+    # Debug/CI: make lazy relationship loads in SSE loops raise instead of issuing N+1 queries
+    SQLA_STRICT_LOADING = os.getenv("SQLA_STRICT_LOADING", "0")
+
     # Twitter OAuth2
     TWITTER_CLIENT_ID = os.getenv("TWITTER_CLIENT_ID", "")
     TWITTER_CLIENT_SECRET = os.getenv("TWITTER_CLIENT_SECRET", "")
@@ -90,6 +90,9 @@ class Token(db.Model):
     __table_args__ = (
         db.Index('ix_tokens_market_cap', 'market_cap'),
         db.Index('ix_tokens_change_24h', 'change_24h'),
+        db.Index('ix_tokens_price', 'price'),
+        db.Index('ix_tokens_hidden_market_cap', 'hidden', 'market_cap'),
+        db.Index('ix_tokens_hidden_change_24h', 'hidden', 'change_24h'),
     )
 
     def to_dict(self):
@@ -132,6 +135,7 @@ class TokenInfo(db.Model):
     launcher = db.relationship("User")
 
     __table_args__ = (
+        db.Index('ix_token_infos_moderation_token', 'moderation_status', 'token_id'),
         db.Index('ix_token_infos_launch_user', 'launch_user_id'),
         db.Index('ix_token_infos_launch_at', 'launch_at'),
     )
@@ -199,6 +203,10 @@ class LightningInvoice(db.Model):
 
     user = db.relationship("User")
 
+    __table_args__ = (
+        db.Index('ix_lightning_invoices_user_created', 'user_id', 'created_at'),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -233,6 +241,10 @@ class LightningWithdrawal(db.Model):
 
     user = db.relationship("User")
 
+    __table_args__ = (
+        db.Index('ix_lightning_withdrawals_user_created', 'user_id', 'created_at'),
+    )
+
     def to_dict(self):
         return {
             "id": self.id,
@@ -264,6 +276,8 @@ class TokenBalance(db.Model):
     __table_args__ = (
         db.UniqueConstraint("user_id", "token_id", name="uq_token_balance_user_token"),
         db.Index('ix_token_balances_token_user', 'token_id', 'user_id'),
+        db.Index('ix_token_balances_token_amount', 'token_id', 'amount'),
+        db.Index('ix_token_balances_user_amount', 'user_id', 'amount'),
     )
 
     def to_dict(self):
@@ -275,6 +289,12 @@ class TokenBalance(db.Model):
         }
 
 
+def fee_bps_for(stage, fee_bps_base) -> int:
+    # Halves at each stage: stage 1: base, 2: base/2, 3: base/4, 4: base/8
+    divisor = 2 ** max(0, int(stage or 1) - 1)
+    return max(1, int(fee_bps_base) // int(divisor))
+
+
 class SwapPool(db.Model):
     __tablename__ = "swap_pools"
 
@@ -306,10 +326,12 @@ class SwapPool(db.Model):
     token_b = db.relationship("Token", foreign_keys=[token_b_id])
     burn_token = db.relationship("Token", foreign_keys=[burn_token_id])
 
+    __table_args__ = (
+        db.Index('ix_swap_pools_tokens', 'token_a_id', 'token_b_id'),
+    )
+
     def current_fee_bps(self) -> int:
-        # Halves at each stage: stage 1: base, 2: base/2, 3: base/4, 4: base/8
-        divisor = 2 ** max(0, int(self.stage or 1) - 1)
-        return max(1, int(self.fee_bps_base) // int(divisor))
+        return fee_bps_for(self.stage, self.fee_bps_base)
 
     def to_dict(self):
         return {
@@ -8,7 +8,7 @@ from flask import current_app
 from sqlalchemy.orm import Session
 
 from ..extensions import db
-from ..models import SwapPool, Token, TokenBalance, SwapTrade
+from ..models import SwapPool, Token, TokenBalance, SwapTrade, fee_bps_for
 
 # Increase precision for AMM math
 getcontext().prec = 40
@@ -32,7 +32,8 @@ def _dec(v) -> Decimal:
 
 
 def current_fee_bps(pool: SwapPool) -> int:
-    return pool.current_fee_bps()
+    # Pool instances and column rows carrying stage/fee_bps_base quote alike
+    return fee_bps_for(pool.stage, pool.fee_bps_base)
 
 
 def _cfg_decimal(key: str, default: str) -> Decimal:
@@ -179,6 +180,24 @@ def _maybe_progress_stage_and_burn(session: Session, pool: SwapPool) -> None:
         session.add(pool)
 
 
+GUSD_SYMBOLS = ("GUSD", "gUSD")
+
+
+def _sync_token_price(pool: SwapPool, token_a: Optional[Token], token_b: Optional[Token]) -> None:
+    """Denormalize a gUSD pair's spot price (gUSD reserve / other reserve) onto the other token's price."""
+    if not token_a or not token_b:
+        return
+    ra, rb = _dec(pool.reserve_a), _dec(pool.reserve_b)
+    if token_b.symbol in GUSD_SYMBOLS and token_a.symbol not in GUSD_SYMBOLS:
+        token, price = token_a, rb / ra
+    elif token_a.symbol in GUSD_SYMBOLS and token_b.symbol not in GUSD_SYMBOLS:
+        token, price = token_b, ra / rb
+    else:
+        return
+    # Token.price is Numeric(20, 8)
+    token.price = price.quantize(Decimal("0.00000001"))
+
+
 def execute_swap(session: Session, pool_id: int, user_id: int, side: str, amount_in: Decimal,
                  min_amount_out: Optional[Decimal] = None,
                  max_slippage_bps: Optional[int] = None) -> Tuple[SwapTrade, Quote, SwapPool]:
@@ -294,6 +313,9 @@ def execute_swap(session: Session, pool_id: int, user_id: int, side: str, amount
     if _dec(pool.reserve_a) <= 0 or _dec(pool.reserve_b) <= 0:
         raise ValueError("pool_exhausted")
 
+    # Keep the stored price of the non-gUSD side in line with the new spot price
+    _sync_token_price(pool, tA, tB)
+
     # Persist pool update and maybe stage progression & burn
     session.add(pool)
     _maybe_progress_stage_and_burn(session, pool)
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import os
+import time
+import threading
+from typing import Dict, Iterable, Optional
+
+# Change notifications for the SSE streams (per-process, fanned out across workers via Redis when
+# REDIS_URL is set). Streams block in wait_for_events() between queries and only re-query when a
+# channel they follow fires, so idle streams stop polling the database every few seconds.
+_PREFIX = "pf:events:"
+_cond = threading.Condition()
+_versions: Dict[str, int] = {}
+_redis_client = None
+_listener_started = False
+_listener_lock = threading.Lock()
+
+
+def _redis_url() -> Optional[str]:
+    return os.getenv("REDIS_URL") or os.getenv("CACHE_REDIS_URL")
+
+
+def fallback_poll_seconds() -> float:
+    """Safety re-query interval for SSE streams between events.
+
+    Without Redis, notify() only wakes streams in the publishing process, so streams served by other
+    workers see new rows on this poll alone; keep it at the old 5s there and stretch it only when
+    events fan out across workers.
+    """
+    return 25 if _redis_url() else 5
+
+
+def _bump(channel: str) -> None:
+    with _cond:
+        _versions[channel] = _versions.get(channel, 0) + 1
+        _cond.notify_all()
+
+
+def _listen(url: str) -> None:
+    import redis
+
+    while True:
+        try:
+            pubsub = redis.Redis.from_url(url).pubsub(ignore_subscribe_messages=True)
+            pubsub.psubscribe(_PREFIX + "*")
+            for msg in pubsub.listen():
+                channel = msg.get("channel")
+                if isinstance(channel, bytes):
+                    channel = channel.decode()
+                if isinstance(channel, str) and channel.startswith(_PREFIX):
+                    _bump(channel[len(_PREFIX):])
+        except Exception:
+            # Connection dropped; streams fall back to their timeout polls until we reconnect
+            time.sleep(5)
+
+
+def _ensure_listener() -> None:
+    global _listener_started
+    url = _redis_url()
+    if not url or _listener_started:
+        return
+    with _listener_lock:
+        if _listener_started:
+            return
+        threading.Thread(target=_listen, args=(url,), name="sse-events", daemon=True).start()
+        _listener_started = True
+
+
+def notify(channel: str) -> None:
+    """Signal that new rows exist for `channel` (e.g. "trades", "launches"). Call after commit."""
+    global _redis_client
+    url = _redis_url()
+    if url:
+        try:
+            if _redis_client is None:
+                import redis
+
+                _redis_client = redis.Redis.from_url(url)
+            # Our own listener delivers it back to this process too
+            _redis_client.publish(_PREFIX + channel, "1")
+            _ensure_listener()
+            return
+        except Exception:
+            pass
+    _bump(channel)
+
+
+def wait_for_events(channels: Iterable[str], seen: Optional[Dict[str, int]], timeout: float) -> Dict[str, int]:
+    """Block until any of `channels` fires after `seen` (a snapshot from a previous call) or `timeout` passes.
+
+    Returns the new snapshot to pass back in; pass None on the first call to snapshot without waiting.
+    """
+    channels = tuple(channels)
+    _ensure_listener()
+    with _cond:
+        if seen is None:
+            return {c: _versions.get(c, 0) for c in channels}
+        _cond.wait_for(
+            lambda: any(_versions.get(c, 0) != seen.get(c, 0) for c in channels),
+            timeout=timeout,
+        )
+        return {c: _versions.get(c, 0) for c in channels}
@@ -4,6 +4,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 from flask import current_app
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from ..extensions import db
@@ -151,7 +152,12 @@ def start_scheduler(app) -> Optional[BackgroundScheduler]:
         return None
     interval = int(app.config.get("RECONCILE_INTERVAL_SECONDS", 60))
 
-    scheduler = BackgroundScheduler(daemon=True)
+    # Same executor setup as the standalone worker: jobs overlap, but never with themselves
+    scheduler = BackgroundScheduler(
+        daemon=True,
+        executors={"default": ThreadPoolExecutor(4)},
+        job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 30},
+    )
 
     def _job_invoices():
         with app.app_context():
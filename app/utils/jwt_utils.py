@@ -1,5 +1,5 @@
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Callable, Dict, Optional, Tuple
 
 import jwt
@@ -20,14 +20,26 @@ def create_jwt(payload: Dict[str, Any], expires_in: Optional[int] = None) -> str
     return jwt.encode(data, secret, algorithm=algo)
 
 
+@lru_cache(maxsize=4096)
+def _decode_cached(token: str, secret: str, algo: str) -> Optional[Dict[str, Any]]:
+    # Tokens are immutable and carry their own exp, so the signature check is done once per token string
+    try:
+        return jwt.decode(token, secret, algorithms=[algo])
+    except Exception:
+        return None
+
+
 def verify_jwt(token: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
     secret = current_app.config["JWT_SECRET"]
     algo = current_app.config.get("JWT_ALGORITHM", "HS256")
-    try:
-        payload = jwt.decode(token, secret, algorithms=[algo])
-        return True, payload
-    except Exception:
+    payload = _decode_cached(token, secret, algo)
+    if payload is None:
+        return False, None
+    # A cached decode outlives the token; re-check expiry on every hit
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
         return False, None
+    return True, dict(payload)
 
 
 def require_auth(f: Callable) -> Callable:
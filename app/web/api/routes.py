@@ -12,12 +12,9 @@ from ...utils.jwt_utils import verify_jwt
 from ...extensions import db, csrf
 from ...models import (
     User,
-    Token,
-    TokenInfo,
     LightningInvoice,
     LightningWithdrawal,
 )
-from sqlalchemy import case
 
 from . import api_bp
 
@@ -375,43 +372,10 @@ Allow: /
 Disallow: /dashboard
 Disallow: /portfolio
 Sitemap: {sitemap}
-""".strip().format(sitemap=url_for("web.api.sitemap_xml", _external=True))
+""".strip().format(sitemap=url_for("web.main.sitemap_xml", _external=True))
     return Response(content, mimetype="text/plain", headers={"Cache-Control": "public, max-age=3600"})
 
 
-@api_bp.route("/sitemap.xml")
-def sitemap_xml():
-    # Basic sitemap
-    urls = [
-        url_for("web.main.home", _external=True),
-        url_for("web.tokens.tokens_list", _external=True),
-        url_for("web.tokens.explore", _external=True),
-        url_for("web.tokens.pro", _external=True),
-        url_for("web.tokens.stats", _external=True),
-        url_for("web.api.about", _external=True),
-        url_for("web.api.faq", _external=True),
-        url_for("web.api.download", _external=True),
-    ]
-    # Token-specific pages
-    for t in Token.query.order_by(
-        case((Token.market_cap == None, 1), else_=0),  # noqa: E711
-        Token.market_cap.desc(),
-    ).all():
-        urls.append(url_for("web.tokens.token_detail", symbol=t.symbol, _external=True))
-        urls.append(url_for("web.trading.pool", symbol=t.symbol, _external=True))
-    # Creator profile pages (based on token launches)
-    creator_ids = (
-        db.session.query(db.func.distinct(TokenInfo.launch_user_id))
-        .filter(TokenInfo.launch_user_id != None)  # noqa: E711
-        .all()
-    )
-    for (cid,) in creator_ids:
-        urls.append(url_for("web.users.creator_profile", user_id=int(cid), _external=True))
-    items = "".join(f"<url><loc>{u}</loc></url>" for u in urls)
-    xml = f"<?xml version='1.0' encoding='UTF-8'?><urlset xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>{items}</urlset>"
-    return Response(xml, mimetype="application/xml", headers={"Cache-Control": "public, max-age=3600"})
-
-
 # Error handlers
 @api_bp.errorhandler(404)
 def not_found_error(error):
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import Optional
 from datetime import datetime, timedelta
+import gzip
 import json
 
 from flask import render_template, request, g, redirect, url_for, Response
@@ -16,9 +17,10 @@ from ...models import (
     SwapTrade,
 )
 from sqlalchemy import case, exists, or_, func
+from sqlalchemy.orm import joinedload
 
 from . import main_bp
-from ..utils import get_gusd_token, amm_price_for_token, cached_trending_items, cached_recent_launches, cached_top_creators, cached_stats
+from ..utils import get_gusd_token, amm_prices_for_tokens, cached_homepage_sections, flush_trade_caches
 
 # Helper: decode JWT from cookie for templates
 COOKIE_NAME = "pf_jwt"
@@ -52,8 +54,10 @@ def inject_user():
 # Home page
 @main_bp.route("/")
 def home():
-    # Cached trending list
-    trending = cached_trending_items()
+    # Cached trending/launches/creators/stats in one cache fetch (after dropping it if trades dirtied it)
+    flush_trade_caches()
+    sections = cached_homepage_sections()
+    trending = sections["trending"]
 
     # Meme Heat: promote memes (crypto culture). Heuristic keyword match on symbol or name.
     meme_keywords = [
@@ -73,22 +77,29 @@ def home():
 
     # Live trades ticker (latest 30 trades across all pools)
     live_trades = []
+    # Pools join in with the trades and their tokens come in one IN query per side
     rows = (
-        SwapTrade.query.order_by(SwapTrade.created_at.desc()).limit(30).all()
+        SwapTrade.query
+        .options(
+            joinedload(SwapTrade.pool).selectinload(SwapPool.token_a),
+            joinedload(SwapTrade.pool).selectinload(SwapPool.token_b),
+        )
+        .order_by(SwapTrade.created_at.desc())
+        .limit(30)
+        .all()
     )
+    gusd = get_gusd_token() if rows else None
     for t in rows:
-        pool = db.session.get(SwapPool, t.pool_id)
+        pool = t.pool
         if not pool:
             continue
         # Determine which token (non-gUSD) this trade refers to
-        gusd = get_gusd_token()
-        token_id = None
+        tok = None
         if gusd:
-            token_id = pool.token_a_id if pool.token_b_id == gusd.id else pool.token_b_id
-        tok = db.session.get(Token, token_id) if token_id else None
+            tok = pool.token_a if pool.token_b_id == gusd.id else pool.token_b
         if not tok:
             # fallback: pick token_a as primary if no gUSD
-            tok = db.session.get(Token, pool.token_a_id)
+            tok = pool.token_a
         # Determine if this was a buy or sell of tok: receiving tok == buy
         recv_token_id = pool.token_b_id if t.side == "AtoB" else pool.token_a_id
         kind = "buy" if (tok and recv_token_id == tok.id) else "sell"
@@ -108,14 +119,9 @@ def home():
             "time": t.created_at.isoformat() + "Z",
         })
 
-    # Recent launches (cached)
-    recent_launches = cached_recent_launches()
-
-    # Top creators (cached)
-    top_creators = cached_top_creators()
-
-    # Marketplace stats (cached)
-    stats = cached_stats()
+    recent_launches = sections["recent_launches"]
+    top_creators = sections["top_creators"]
+    stats = sections["stats"]
 
     tokens = (
         Token.query
@@ -130,14 +136,13 @@ def home():
     all_tokens = Token.query.filter(Token.change_24h != None).all()  # noqa: E711
     movers_gainers = sorted(all_tokens, key=lambda t: float(t.change_24h or 0), reverse=True)[:6]
     movers_losers = sorted(all_tokens, key=lambda t: float(t.change_24h or 0))[:6]
-    # Compute AMM prices for tokens displayed on this page
+    # Compute AMM prices for tokens displayed on this page (one pool query for all of them)
+    shown = tokens + movers_gainers + movers_losers
+    amm_prices = amm_prices_for_tokens(t.id for t in shown if t)
     price_by_symbol: dict[str, Optional[float]] = {}
-    for t in tokens:
-        if t and t.symbol:
-            price_by_symbol[t.symbol] = amm_price_for_token(t) or (float(t.price or 0) if t.price is not None else None)
-    for t in movers_gainers + movers_losers:
+    for t in shown:
         if t and t.symbol and t.symbol not in price_by_symbol:
-            price_by_symbol[t.symbol] = amm_price_for_token(t) or (float(t.price or 0) if t.price is not None else None)
+            price_by_symbol[t.symbol] = amm_prices.get(t.id) or (float(t.price or 0) if t.price is not None else None)
     return render_template(
         "home.html",
         tokens=tokens,
@@ -157,3 +162,48 @@ def home():
     )
 
 
+SITEMAP_CACHE_KEY = "sitemap_xml_v1"
+
+
+def _build_sitemap_xml() -> str:
+    # Basic sitemap
+    urls = [
+        url_for("web.main.home", _external=True),
+        url_for("web.tokens.tokens_list", _external=True),
+        url_for("web.tokens.explore", _external=True),
+        url_for("web.tokens.pro", _external=True),
+        url_for("web.tokens.stats", _external=True),
+    ]
+    # Token-specific pages
+    for t in Token.query.order_by(
+        case((Token.market_cap == None, 1), else_=0),  # noqa: E711
+        Token.market_cap.desc(),
+    ).all():
+        urls.append(url_for("web.tokens.token_detail", symbol=t.symbol, _external=True))
+        urls.append(url_for("web.trading.pool", symbol=t.symbol, _external=True))
+    # Creator profile pages (based on token launches)
+    creator_ids = (
+        db.session.query(db.func.distinct(TokenInfo.launch_user_id))
+        .filter(TokenInfo.launch_user_id != None)  # noqa: E711
+        .all()
+    )
+    for (cid,) in creator_ids:
+        urls.append(url_for("web.users.creator_profile", user_id=int(cid), _external=True))
+    items = "".join(f"<url><loc>{u}</loc></url>" for u in urls)
+    return f"<?xml version='1.0' encoding='UTF-8'?><urlset xmlns='http://www.sitemaps.org/schemas/sitemap/0.9'>{items}</urlset>"
+
+
+@main_bp.route("/sitemap.xml")
+def sitemap_xml():
+    # Keep both the plain and pre-gzipped body cached so hits skip rebuild and recompression
+    cached = cache.get(SITEMAP_CACHE_KEY)
+    if not cached:
+        xml = _build_sitemap_xml().encode("utf-8")
+        cached = (xml, gzip.compress(xml, compresslevel=9))
+        cache.set(SITEMAP_CACHE_KEY, cached, timeout=600)
+    xml, xml_gz = cached
+    headers = {"Cache-Control": "public, max-age=3600", "Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("Accept-Encoding", "").lower():
+        headers["Content-Encoding"] = "gzip"
+        return Response(xml_gz, mimetype="application/xml", headers=headers)
+    return Response(xml, mimetype="application/xml", headers=headers)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from functools import wraps
-from typing import Optional
+from functools import wraps, lru_cache
+from typing import NamedTuple, Optional
 from decimal import Decimal, InvalidOperation
 from datetime import datetime, timedelta
+import csv
+import io
+import re
 import time
 import json
+import base64
+import hashlib
 
-from flask import render_template, request, g, redirect, url_for, abort, flash, Response, current_app
+import orjson
+from flask import render_template, request, g, redirect, url_for, abort, flash, Response, current_app, stream_with_context
 from urllib.parse import urlsplit
 
 from ...utils.jwt_utils import verify_jwt
@@ -22,8 +28,22 @@ from ...models import (
     TwitterUser,
     UserTwitterConnection,
 )
-from sqlalchemy import case, exists, or_, func
+from sqlalchemy import Float, case, cast, delete, exists, insert, literal, or_, func, select
+from sqlalchemy.orm import joinedload, contains_eager, load_only, raiseload
 from ...services.metrics import inc_sse, dec_sse
+from ...services.events import fallback_poll_seconds, notify, wait_for_events
+# The cached gUSD id lives with the shared home page builders so both sides use one cache entry
+from ..utils import (
+    _get_gusd_token_id_cached,
+    amm_prices_for_tokens,
+    cached_homepage_sections,
+    cached_recent_launches,
+    cached_stats,
+    cached_top_creators,
+    cached_trending_items,
+    flush_trade_caches,
+    mark_trade_caches_dirty,
+)
 
 from . import tokens_bp
 
@@ -32,12 +52,16 @@ COOKIE_NAME = "pf_jwt"
 
 
 def get_jwt_from_cookie() -> Optional[dict]:
+    # Verify the cookie at most once per request
+    if "jwt_payload_cached" in g:
+        return g.jwt_payload_cached
+    payload = None
     token = request.cookies.get(COOKIE_NAME)
-    if not token:
-        return None
-    ok, payload = verify_jwt(token)
-    if not ok:
-        return None
+    if token:
+        ok, decoded = verify_jwt(token)
+        if ok:
+            payload = decoded
+    g.jwt_payload_cached = payload
     return payload
 
 
@@ -56,6 +80,8 @@ def require_auth_web(f):
 @tokens_bp.app_context_processor
 def inject_user():
     """Make current user (if any) available to templates as `current_user`."""
+    if "current_user" in g:
+        return {"current_user": g.current_user}
     payload = get_jwt_from_cookie()
     user = None
     if payload:
@@ -65,41 +91,191 @@ def inject_user():
             user = db.session.get(User, uid)
         if not user and isinstance(sub, str):
             user = User.query.filter_by(pubkey_hex=sub.lower()).first()
+    g.current_user = user
     return {"current_user": user}
 
 
 def _get_gusd_token() -> Optional[Token]:
-    return Token.query.filter_by(symbol="GUSD").first() or Token.query.filter_by(symbol="gUSD").first()
+    # Resolved once per request from the process-cached id; session.get hits the identity map
+    if "gusd_token" not in g:
+        gusd_id = _get_gusd_token_id_cached()
+        g.gusd_token = db.session.get(Token, gusd_id) if gusd_id else None
+    return g.gusd_token
 
 
 def _amm_price_for_token(token: Token) -> Optional[float]:
     """Compute AMM price for token against gUSD if such a pool exists."""
-    gusd = _get_gusd_token()
-    if not gusd:
+    gusd_id = _get_gusd_token_id_cached()
+    pool_id = _gusd_pool_id_cached(token.id, gusd_id) if gusd_id else None
+    if not pool_id:
+        return None
+    # Primary-key read of the live reserves (the SSE price stream calls this in a loop, so no identity map)
+    row = (
+        db.session.query(SwapPool.token_b_id, cast(SwapPool.reserve_a, Float), cast(SwapPool.reserve_b, Float))
+        .filter(SwapPool.id == pool_id)
+        .first()
+    )
+    if not row:
+        cache.delete_memoized(_gusd_pool_id_cached, token.id, gusd_id)
         return None
-    pool = (
-        SwapPool.query.filter(
-            ((SwapPool.token_a_id == token.id) & (SwapPool.token_b_id == gusd.id))
-            | ((SwapPool.token_b_id == token.id) & (SwapPool.token_a_id == gusd.id))
-        ).first()
+    token_b_id, reserve_a, reserve_b = row
+    if not reserve_a or not reserve_b:
+        return None
+    return reserve_b / reserve_a if token_b_id == gusd_id else reserve_a / reserve_b
+
+
+@cache.memoize(timeout=3600)
+def _gusd_pool_id_cached(token_id: int, gusd_id: int) -> Optional[int]:
+    # A token's gUSD pair doesn't move once created; None is not cached, so a new pool is picked up right away
+    return (
+        db.session.query(SwapPool.id)
+        .filter(
+            ((SwapPool.token_a_id == token_id) & (SwapPool.token_b_id == gusd_id))
+            | ((SwapPool.token_b_id == token_id) & (SwapPool.token_a_id == gusd_id))
+        )
+        .order_by(SwapPool.id)
+        .limit(1)
+        .scalar()
     )
-    if not pool or not pool.reserve_a or not pool.reserve_b:
+
+
+def _gusd_pool_for_token(token_id: int, gusd_id: Optional[int]) -> Optional[SwapPool]:
+    """The token's gUSD pool via the cached id; session.get reuses the identity map within a request."""
+    pool_id = _gusd_pool_id_cached(token_id, gusd_id) if gusd_id else None
+    if not pool_id:
         return None
+    pool = db.session.get(SwapPool, pool_id)
+    if pool is None:
+        cache.delete_memoized(_gusd_pool_id_cached, token_id, gusd_id)
+    return pool
+
+
+def _amm_prices_for_tokens(tokens) -> dict:
+    """Batch AMM prices against gUSD for many tokens in one pool query: {token_id: price}."""
+    return amm_prices_for_tokens(t.id for t in tokens if t is not None)
+
+
+def _price_by_symbol(tokens) -> dict:
+    """AMM price when available, falling back to the stored token price."""
+    amm_prices = _amm_prices_for_tokens(tokens)
+    return {
+        t.symbol: (amm_prices.get(t.id) or float(t.price or 0))
+        for t in tokens
+        if t and t.symbol
+    }
+
+
+TOKENS_CACHE_VERSION_KEY = "tokens_cache_v"
+
+
+def _tokens_cache_version() -> int:
+    return int(cache.get(TOKENS_CACHE_VERSION_KEY) or 0)
+
+
+def _bump_tokens_cache_version() -> None:
+    """Invalidate every cached token listing variant at once (O(1), no key scan)."""
     try:
-        if pool.token_b_id == gusd.id:
-            pr = (pool.reserve_b / pool.reserve_a)
-        elif pool.token_a_id == gusd.id:
-            pr = (pool.reserve_a / pool.reserve_b)
-        else:
-            pr = None
-        return float(pr) if pr is not None else None
+        cache.cache.inc(TOKENS_CACHE_VERSION_KEY, 1)
+    except Exception:
+        cache.set(TOKENS_CACHE_VERSION_KEY, _tokens_cache_version() + 1, timeout=0)
+
+
+def _invalidate_trade_caches() -> None:
+    """Mark the trade-derived homepage caches stale after a trade (throttled, see web.utils)."""
+    mark_trade_caches_dirty()
+
+
+def _tokens_view_cache_key(*args, **kwargs) -> str:
+    """Cache key for token listing views: listing version + path + sorted query args."""
+    args_hash = hashlib.md5(
+        repr(sorted(request.args.items(multi=True))).encode()
+    ).hexdigest()
+    return f"tokens:v{_tokens_cache_version()}:{request.path}:{args_hash}"
+
+
+def _order_nulls_last(col, order: str = "desc") -> tuple:
+    """ORDER BY clauses sorting `col` with NULLs last, in a form the column's index can serve."""
+    direction = col.asc() if order == "asc" else col.desc()
+    if db.engine.dialect.name in ("mysql", "mariadb"):
+        # No NULLS LAST syntax; NULLs already sort last under DESC
+        return (direction,) if order != "asc" else (col.is_(None), direction)
+    return (direction.nulls_last(),)
+
+
+def _visible_tokens(qry):
+    """Restrict a Token query to tokens that are neither hidden nor moderated as hidden."""
+    return qry.outerjoin(TokenInfo, TokenInfo.token_id == Token.id).filter(
+        Token.hidden == False,  # noqa: E712
+        (TokenInfo.moderation_status == None) | (TokenInfo.moderation_status != 'hidden'),  # noqa: E711
+    )
+
+
+# Token columns the list/explore templates actually read
+_TOKEN_LIST_COLUMNS = (Token.id, Token.symbol, Token.name, Token.price, Token.market_cap, Token.change_24h)
+
+
+def _encode_cursor(value, token_id: int) -> str:
+    """Opaque keyset cursor for the last row of a page: base64 of [sort value, id]."""
+    if isinstance(value, Decimal):
+        value = str(value)
+    raw = json.dumps([value, token_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: Optional[str], sort_col):
+    """Decode an `after` cursor for `sort_col`; None (offset paging) if it is malformed or mistyped.
+
+    The value comes back typed for the column (Decimal for Numeric sorts), so an edited or stale
+    cursor can never reach the query as a value the database would reject.
+    """
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, token_id = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
     except Exception:
         return None
+    if not isinstance(token_id, int) or isinstance(token_id, bool):
+        return None
+    if value is None:
+        return None, token_id
+    if isinstance(sort_col.type, db.Numeric):
+        if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+            return None
+        try:
+            value = Decimal(str(value))
+        except InvalidOperation:
+            return None
+        if not value.is_finite():
+            return None
+    elif not isinstance(value, str):
+        return None
+    return value, token_id
+
+
+def _keyset_filter(sort_col, order: str, cursor):
+    """Seek predicate matching ORDER BY (sort_col IS NULL), sort_col, Token.id (nulls last)."""
+    value, last_id = cursor
+    id_after = Token.id > last_id if order == "asc" else Token.id < last_id
+    if value is None:
+        return (sort_col == None) & id_after  # noqa: E711
+    col_after = sort_col > value if order == "asc" else sort_col < value
+    return col_after | ((sort_col == value) & id_after) | (sort_col == None)  # noqa: E711
+
+
+def _cached_count(qry, *key_parts, timeout: int = 120) -> int:
+    """Count rows of a filtered Token query, cached per filter combination."""
+    key = f"count:tokens:v{_tokens_cache_version()}:" + hashlib.sha1(repr(key_parts).encode()).hexdigest()
+    total = cache.get(key)
+    if total is None:
+        total = qry.order_by(None).with_entities(func.count(Token.id)).scalar() or 0
+        cache.set(key, total, timeout=timeout)
+    return total
 
 
 # Tokens list page
 @tokens_bp.route("/")
-@cache.cached(timeout=60, query_string=True)
+@cache.cached(timeout=60, make_cache_key=_tokens_view_cache_key)
 def tokens_list():
     # Simple list with search/sort/pagination
     q = request.args.get("q", type=str)
@@ -110,18 +286,13 @@ def tokens_list():
     stage = request.args.get("stage", type=str)
     category = request.args.get("category", type=str)
 
-    qry = Token.query
+    qry = Token.query.options(load_only(*_TOKEN_LIST_COLUMNS))
     # Exclude hidden tokens and those moderated as hidden
-    try:
-        qry = qry.outerjoin(TokenInfo, TokenInfo.token_id == Token.id)
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
-        qry = qry.filter((TokenInfo.moderation_status == None) | (TokenInfo.moderation_status != 'hidden'))  # noqa: E711
-        # Category filter
-        if category:
-            like_cat = f"%{category.strip()}%"
-            qry = qry.filter(TokenInfo.categories.ilike(like_cat))
-    except Exception:
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
+    qry = _visible_tokens(qry)
+    # Category filter
+    if category:
+        like_cat = f"%{category.strip()}%"
+        qry = qry.filter(TokenInfo.categories.ilike(like_cat))
     if q:
         like = f"%{q}%"
         qry = qry.filter((Token.symbol.ilike(like)) | (Token.name.ilike(like)))
@@ -142,25 +313,26 @@ def tokens_list():
         "name": Token.name,
     }.get(sort, Token.market_cap)
 
+    total = _cached_count(qry, "list", q, stage, category)
+
     if order == "asc":
-        qry = qry.order_by(
-            case((sort_col == None, 1), else_=0),  # noqa: E711
-            sort_col.asc(),
-        )
+        qry = qry.order_by(*_order_nulls_last(sort_col, "asc"), Token.id.asc())
     else:
-        qry = qry.order_by(
-            case((sort_col == None, 1), else_=0),  # noqa: E711
-            sort_col.desc(),
-        )
+        qry = qry.order_by(*_order_nulls_last(sort_col, "desc"), Token.id.desc())
 
-    total = qry.count()
     if page < 1:
         page = 1
     if per < 1:
         per = 12
-    tokens = qry.limit(per).offset((page - 1) * per).all()
+    # Seek past the previous page's last row when a cursor is supplied; offset otherwise
+    cursor = _decode_cursor(request.args.get("after", type=str), sort_col)
+    if cursor:
+        tokens = qry.filter(_keyset_filter(sort_col, order, cursor)).limit(per).all()
+    else:
+        tokens = qry.limit(per).offset((page - 1) * per).all()
+    next_cursor = _encode_cursor(getattr(tokens[-1], sort_col.key), tokens[-1].id) if tokens else None
     # AMM prices for page tokens
-    price_by_symbol = {t.symbol: (_amm_price_for_token(t) or float(t.price or 0)) for t in tokens if t and t.symbol}
+    price_by_symbol = _price_by_symbol(tokens)
     pages = (total + per - 1) // per if per else 1
 
     return render_template(
@@ -173,6 +345,7 @@ def tokens_list():
         per=per,
         total=total,
         pages=pages,
+        next_cursor=next_cursor,
         price_by_symbol=price_by_symbol,
         meta_title="Tokens — Postfun",
         meta_description="Browse tokens by market cap, price and 24h change on Postfun.",
@@ -180,115 +353,74 @@ def tokens_list():
     )
 
 
-# Token detail page
-@tokens_bp.route("/<symbol>")
-def token_detail(symbol: str):
-    token = Token.query.filter_by(symbol=symbol).first()
-    if not token:
-        abort(404)
-    # Respect hidden/moderation flags
-    try:
-        info = TokenInfo.query.filter_by(token_id=token.id).first()
-        if bool(getattr(token, "hidden", False)) or (info and getattr(info, "moderation_status", None) == "hidden"):
-            abort(404)
-    except Exception:
-        pass
-    # Check watchlist status for current user if logged in
+def _token_user_flags(uid, token_id: int, launcher_id: Optional[int]) -> tuple[bool, bool]:
+    """(watchlisted, is_following) for the logged-in user, in a single query."""
     watchlisted = False
-    payload = get_jwt_from_cookie()
-    if payload:
-        uid = payload.get("uid")
-        user = None
-        if isinstance(uid, int):
-            user = db.session.get(User, uid)
-        if user:
-            watchlisted = (
-                WatchlistItem.query.filter_by(user_id=user.id, token_id=token.id).first() is not None
+    is_following = False
+    user = db.session.get(User, uid) if isinstance(uid, int) else None
+    if user:
+        checks = [
+            exists().where(
+                WatchlistItem.user_id == user.id, WatchlistItem.token_id == token_id
+            ).label("watchlisted")
+        ]
+        if launcher_id:
+            checks.append(
+                exists().where(
+                    CreatorFollow.follower_user_id == user.id,
+                    CreatorFollow.creator_user_id == launcher_id,
+                ).label("is_following")
             )
-    # Compute AMM price for display
-    price = _amm_price_for_token(token) or float(token.price or 0)
-
-    # Token info (for SEO)
-    info = TokenInfo.query.filter_by(token_id=token.id).first()
-    launcher = None
-    try:
-        if info and info.launch_user_id:
-            launcher = db.session.get(User, int(info.launch_user_id))
-    except Exception:
-        launcher = None
-    meta_title = f"{token.symbol} – {token.name} | Postfun"
-    meta_description = (info.description if info and info.description else "From posts to markets. Turn vibes into value on Postfun.")
-    meta_image = info.logo_url if (info and info.logo_url) else None
-    meta_url = url_for("web.tokens.token_detail", symbol=token.symbol, _external=True)
-
-    # JSON-LD structured data (Product)
-    jsonld = {
-        "@context": "https://schema.org",
-        "@type": "Product",
-        "name": f"{token.name} ({token.symbol})",
-        "url": meta_url,
-        "brand": {"@type": "Brand", "name": "Postfun"},
-    }
-    if meta_image:
-        jsonld["image"] = meta_image
-    try:
-        pr = float(price or 0)
-        if pr > 0:
-            jsonld["offers"] = {
-                "@type": "Offer",
-                "price": f"{pr:.6f}",
-                "priceCurrency": "USD",
-                "url": meta_url,
-                "availability": "https://schema.org/InStock",
-            }
-    except Exception:
-        pass
+        flags = db.session.query(*checks).one()
+        watchlisted = bool(flags[0])
+        is_following = bool(flags[1]) if launcher_id else False
+    return watchlisted, is_following
 
-    # Follow status (for quick follow/unfollow from token page)
-    is_following = False
-    if launcher and payload and isinstance(payload.get("uid"), int):
-        me = db.session.get(User, int(payload["uid"]))
-        if me:
-            row = CreatorFollow.query.filter_by(follower_user_id=me.id, creator_user_id=launcher.id).first()
-            is_following = row is not None
 
+def _token_fee_summary(token_id: int, gusd_id: Optional[int]):
     # Preferred pool to compute fee summary (gUSD pair if possible)
-    fee_summary = None
     try:
-        gusd = _get_gusd_token()
-        pool = None
-        if gusd:
-            pool = SwapPool.query.filter(
-                ((SwapPool.token_a_id == token.id) & (SwapPool.token_b_id == gusd.id))
-                | ((SwapPool.token_b_id == token.id) & (SwapPool.token_a_id == gusd.id))
-            ).first()
+        pool = _gusd_pool_for_token(token_id, gusd_id)
         if not pool:
-            pool = SwapPool.query.filter((SwapPool.token_a_id == token.id) | (SwapPool.token_b_id == token.id)).first()
+            pool = SwapPool.query.filter((SwapPool.token_a_id == token_id) | (SwapPool.token_b_id == token_id)).first()
         if pool:
-            fee_summary = _fee_summary_for_pool_cached(pool.id)
+            return _fee_summary_for_pool_cached(pool.id)
     except Exception:
-        pass
+        current_app.logger.exception(f"token_detail: failed to load fee summary for token {token_id}")
+    return None
+
 
-    # Get token holders
+def _token_holders(token_id: int, total_supply: float) -> tuple[list, int]:
     token_holders = []
     holders_count = 0
     try:
-        # Get token balances for this token, ordered by amount descending
-        balances = (
-            TokenBalance.query
+        # Get token balances for this token, ordered by amount descending.
+        # Holder users load in the same query; window aggregates give the total holders
+        # and the supply across all of them (not just the top 50).
+        rows = (
+            db.session.query(
+                TokenBalance,
+                func.count().over().label("total"),
+                func.sum(TokenBalance.amount).over().label("supply"),
+            )
             .join(User, TokenBalance.user_id == User.id)
-            .filter(TokenBalance.token_id == token.id, TokenBalance.amount > 0)
+            .options(
+                contains_eager(TokenBalance.user).load_only(
+                    User.id, User.npub, User.pubkey_hex, User.display_name
+                )
+            )
+            .filter(TokenBalance.token_id == token_id, TokenBalance.amount > 0)
             .order_by(TokenBalance.amount.desc())
             .limit(50)
             .all()
         )
-        holders_count = TokenBalance.query.filter(TokenBalance.token_id == token.id, TokenBalance.amount > 0).count()
+        balances = [row[0] for row in rows]
+        holders_count = int(rows[0].total) if rows else 0
 
         # Calculate total supply for percentage calculation
-        total_supply = float(info.total_supply or 0) if info else 0
-        if total_supply == 0:
-            # Fallback: sum all balances
-            total_supply = sum(float(balance.amount or 0) for balance in balances)
+        if total_supply == 0 and rows:
+            # Fallback: sum of all positive balances
+            total_supply = float(rows[0].supply or 0)
 
         # Format holders data
         for i, balance in enumerate(balances):
@@ -301,66 +433,129 @@ def token_detail(symbol: str):
                 'percentage': percentage
             })
     except Exception:
-        pass
+        current_app.logger.exception(f"token_detail: failed to load holders for token {token_id}")
+    return token_holders, holders_count
+
 
-    # Get recent trades for this token
+def _token_recent_trades(token_id: int, gusd_id: Optional[int]) -> list:
     recent_trades = []
     try:
         # Find pools that include this token
         pools = SwapPool.query.filter(
-            (SwapPool.token_a_id == token.id) | (SwapPool.token_b_id == token.id)
+            (SwapPool.token_a_id == token_id) | (SwapPool.token_b_id == token_id)
         ).all()
 
-        for pool in pools:
-            # Get recent trades for this pool
+        pool_by_id = {p.id: p for p in pools}
+
+        # Latest trades across all of the token's pools in one query
+        trades = []
+        if pool_by_id:
             trades = (
                 SwapTrade.query
-                .join(User, SwapTrade.user_id == User.id)
-                .filter(SwapTrade.pool_id == pool.id)
+                .options(joinedload(SwapTrade.user))
+                .filter(SwapTrade.pool_id.in_(list(pool_by_id)))
                 .order_by(SwapTrade.created_at.desc())
                 .limit(20)
                 .all()
             )
 
-            for trade in trades:
-                # Determine if this is a buy or sell for this token
-                is_buy = False
-                trade_amount = 0
-                trade_price = 0
-
-                if pool.token_a_id == token.id:
-                    # Token A: AtoB = selling token A, BtoA = buying token A
-                    is_buy = trade.side == "BtoA"
-                    trade_amount = float(trade.amount_out if is_buy else trade.amount_in)
-                    # Calculate price
-                    if pool.token_b_id == gusd.id:
-                        trade_price = float(trade.amount_out / trade.amount_in) if trade.amount_in else 0
-                    else:
-                        trade_price = float(trade.amount_in / trade.amount_out) if trade.amount_out else 0
+        for trade in trades:
+            pool = pool_by_id[trade.pool_id]
+            # Determine if this is a buy or sell for this token
+            is_buy = False
+            trade_amount = 0
+            trade_price = 0
+
+            if pool.token_a_id == token_id:
+                # Token A: AtoB = selling token A, BtoA = buying token A
+                is_buy = trade.side == "BtoA"
+                trade_amount = float(trade.amount_out if is_buy else trade.amount_in)
+                # Calculate price
+                if pool.token_b_id == gusd_id:
+                    trade_price = float(trade.amount_out / trade.amount_in) if trade.amount_in else 0
                 else:
-                    # Token B: AtoB = buying token B, BtoA = selling token B
-                    is_buy = trade.side == "AtoB"
-                    trade_amount = float(trade.amount_out if is_buy else trade.amount_in)
-                    # Calculate price
-                    if pool.token_a_id == gusd.id:
-                        trade_price = float(trade.amount_in / trade.amount_out) if trade.amount_out else 0
-                    else:
-                        trade_price = float(trade.amount_out / trade.amount_in) if trade.amount_in else 0
-
-                trade_total = trade_amount * trade_price
-
-                recent_trades.append({
-                    'created_at': trade.created_at,
-                    'type': 'buy' if is_buy else 'sell',
-                    'amount': trade_amount,
-                    'price': trade_price,
-                    'total': trade_total,
-                    'user': trade.user
-                })
-
-        # Sort by time and limit to most recent
-        recent_trades.sort(key=lambda x: x['created_at'], reverse=True)
-        recent_trades = recent_trades[:20]
+                    trade_price = float(trade.amount_in / trade.amount_out) if trade.amount_out else 0
+            else:
+                # Token B: AtoB = buying token B, BtoA = selling token B
+                is_buy = trade.side == "AtoB"
+                trade_amount = float(trade.amount_out if is_buy else trade.amount_in)
+                # Calculate price
+                if pool.token_a_id == gusd_id:
+                    trade_price = float(trade.amount_in / trade.amount_out) if trade.amount_out else 0
+                else:
+                    trade_price = float(trade.amount_out / trade.amount_in) if trade.amount_in else 0
+
+            trade_total = trade_amount * trade_price
+
+            recent_trades.append({
+                'created_at': trade.created_at,
+                'type': 'buy' if is_buy else 'sell',
+                'amount': trade_amount,
+                'price': trade_price,
+                'total': trade_total,
+                'user': trade.user
+            })
+    except Exception:
+        current_app.logger.exception(f"token_detail: failed to load recent trades for token {token_id}")
+    return recent_trades
+
+
+# Token detail page
+@tokens_bp.route("/<symbol>")
+def token_detail(symbol: str):
+    # Token, its info and the launcher in one round trip
+    row = (
+        db.session.query(Token, TokenInfo, User)
+        .select_from(Token)
+        .outerjoin(TokenInfo, TokenInfo.token_id == Token.id)
+        .outerjoin(User, User.id == TokenInfo.launch_user_id)
+        .filter(Token.symbol == symbol)
+        .first()
+    )
+    if not row:
+        abort(404)
+    token, info, launcher = row
+    # Respect hidden/moderation flags
+    if bool(getattr(token, "hidden", False)) or (info and getattr(info, "moderation_status", None) == "hidden"):
+        abort(404)
+    payload = get_jwt_from_cookie()
+    uid = payload.get("uid") if payload else None
+    total_supply = float(info.total_supply or 0) if info else 0
+    gusd_id = _get_gusd_token_id_cached()
+    # Small indexed reads on the request session, so the ORM rows stay attached while the template renders
+    watchlisted, is_following = _token_user_flags(uid, token.id, launcher.id if launcher else None)
+    fee_summary = _token_fee_summary(token.id, gusd_id)
+    token_holders, holders_count = _token_holders(token.id, total_supply)
+    recent_trades = _token_recent_trades(token.id, gusd_id)
+
+    # Compute AMM price for display
+    price = _amm_price_for_token(token) or float(token.price or 0)
+
+    meta_title = f"{token.symbol} – {token.name} | Postfun"
+    meta_description = (info.description if info and info.description else "From posts to markets. Turn vibes into value on Postfun.")
+    meta_image = info.logo_url if (info and info.logo_url) else None
+    meta_url = url_for("web.tokens.token_detail", symbol=token.symbol, _external=True)
+
+    # JSON-LD structured data (Product)
+    jsonld = {
+        "@context": "https://schema.org",
+        "@type": "Product",
+        "name": f"{token.name} ({token.symbol})",
+        "url": meta_url,
+        "brand": {"@type": "Brand", "name": "Postfun"},
+    }
+    if meta_image:
+        jsonld["image"] = meta_image
+    try:
+        pr = float(price or 0)
+        if pr > 0:
+            jsonld["offers"] = {
+                "@type": "Offer",
+                "price": f"{pr:.6f}",
+                "priceCurrency": "USD",
+                "url": meta_url,
+                "availability": "https://schema.org/InStock",
+            }
     except Exception:
         pass
 
@@ -386,9 +581,31 @@ def token_detail(symbol: str):
 
 
 
+@cache.memoize(timeout=300)
+def _top_categories(limit: int = 12) -> list[str]:
+    """Most frequent launch categories (case-insensitive), keeping the first-seen casing."""
+    from collections import Counter
+    cnt = Counter()
+    first_case = {}
+    rows = (
+        db.session.query(TokenInfo.categories)
+        .filter(TokenInfo.categories != None, TokenInfo.categories != "")  # noqa: E711
+        .all()
+    )
+    for (s,) in rows:
+        for c in s.split(','):
+            c = c.strip()
+            if not c:
+                continue
+            lc = c.lower()
+            cnt[lc] += 1
+            first_case.setdefault(lc, c)
+    return [first_case[k] for k, _ in cnt.most_common(limit)]
+
+
 # Explore page
 @tokens_bp.route("/explore")
-@cache.cached(timeout=60, query_string=True)
+@cache.cached(timeout=60, make_cache_key=_tokens_view_cache_key)
 def explore():
     # Filters: q (search), filter (gainers|losers|all), sort (market_cap|price|change_24h), order (desc|asc)
     # Ranges: price_min, price_max, change_min, change_max; Pagination: page, per
@@ -418,18 +635,13 @@ def explore():
     change_min = parse_dec(change_min_s)
     change_max = parse_dec(change_max_s)
 
-    qry = Token.query
+    qry = Token.query.options(load_only(*_TOKEN_LIST_COLUMNS))
     # Exclude hidden tokens and those moderated as hidden
-    try:
-        qry = qry.outerjoin(TokenInfo, TokenInfo.token_id == Token.id)
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
-        qry = qry.filter((TokenInfo.moderation_status == None) | (TokenInfo.moderation_status != 'hidden'))  # noqa: E711
-        # Category filter (comma-separated contains match)
-        if category:
-            like_cat = f"%{category.strip()}%"
-            qry = qry.filter(TokenInfo.categories.ilike(like_cat))
-    except Exception:
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
+    qry = _visible_tokens(qry)
+    # Category filter (comma-separated contains match)
+    if category:
+        like_cat = f"%{category.strip()}%"
+        qry = qry.filter(TokenInfo.categories.ilike(like_cat))
     if q:
         like = f"%{q}%"
         qry = qry.filter((Token.symbol.ilike(like)) | (Token.name.ilike(like)))
@@ -455,6 +667,11 @@ def explore():
             ).where(SwapPool.stage == s_val)
         )
 
+    total = _cached_count(
+        qry, "explore", q, filt, stage, category, price_min_s, price_max_s, change_min_s, change_max_s
+    )
+
+    sort_col = None
     if sort == "stage":
         stage_max = (
             db.session.query(func.coalesce(func.max(SwapPool.stage), 0))
@@ -474,49 +691,33 @@ def explore():
         }.get(sort, Token.market_cap)
 
         if order == "asc":
-            qry = qry.order_by(
-                case((sort_col == None, 1), else_=0),  # noqa: E711
-                sort_col.asc(),
-            )
+            qry = qry.order_by(*_order_nulls_last(sort_col, "asc"), Token.id.asc())
         else:
-            qry = qry.order_by(
-                case((sort_col == None, 1), else_=0),  # noqa: E711
-                sort_col.desc(),
-            )
+            qry = qry.order_by(*_order_nulls_last(sort_col, "desc"), Token.id.desc())
 
-    total = qry.count()
     if page < 1:
         page = 1
     if per < 1:
         per = 12
-    tokens = qry.limit(per).offset((page - 1) * per).all()
+    # Keyset pagination for column sorts; the computed stage sort keeps offset paging
+    cursor = _decode_cursor(request.args.get("after", type=str), sort_col) if sort_col is not None else None
+    if cursor:
+        tokens = qry.filter(_keyset_filter(sort_col, order, cursor)).limit(per).all()
+    else:
+        tokens = qry.limit(per).offset((page - 1) * per).all()
+    next_cursor = (
+        _encode_cursor(getattr(tokens[-1], sort_col.key), tokens[-1].id)
+        if tokens and sort_col is not None
+        else None
+    )
     pages = (total + per - 1) // per if per else 1
 
     # AMM prices for tokens on this page
-    price_by_symbol = {t.symbol: (_amm_price_for_token(t) or float(t.price or 0)) for t in tokens if t and t.symbol}
+    price_by_symbol = _price_by_symbol(tokens)
 
     # Quick category chips (top 12 by frequency across all TokenInfo)
-    top_categories: list[str] = []
     try:
-        cats = []
-        for row in TokenInfo.query.with_entities(TokenInfo.categories).all():
-            s = row[0]
-            if not s:
-                continue
-            for c in s.split(','):
-                c = c.strip()
-                if c:
-                    cats.append(c)
-        from collections import Counter
-        cnt = Counter([c.lower() for c in cats])
-        # preserve original casing for popular tags if present in cats
-        # Build map of lower->first seen original
-        first_case = {}
-        for c in cats:
-            lc = c.lower()
-            if lc not in first_case:
-                first_case[lc] = c
-        top_categories = [first_case[k] for k, _ in cnt.most_common(12)]
+        top_categories = _top_categories()
     except Exception:
         top_categories = []
 
@@ -532,8 +733,12 @@ def explore():
             .limit(6)
             .all()
         )
+        # One IN query for the winners, then restore volume order
+        tokens_by_id = {}
+        if rows:
+            tokens_by_id = {t.id: t for t in Token.query.filter(Token.id.in_([tid for tid, _ in rows])).all()}
         for tid, vol in rows:
-            t = db.session.get(Token, tid)
+            t = tokens_by_id.get(tid)
             if t:
                 most_active_24h.append({"token": t, "vol_24h": float(vol or 0)})
     except Exception:
@@ -541,7 +746,8 @@ def explore():
 
     # Trending items (reuse cached builder from home)
     try:
-        trending_items = _cached_trending_items()[:6]
+        flush_trade_caches()
+        trending_items = cached_trending_items()[:6]
     except Exception:
         trending_items = []
 
@@ -558,6 +764,7 @@ def explore():
         per=per,
         total=total,
         pages=pages,
+        next_cursor=next_cursor,
         price_min=price_min_s or "",
         price_max=price_max_s or "",
         change_min=change_min_s or "",
@@ -572,25 +779,16 @@ def explore():
     )
 
 
-import re
+# Twitter/X status URL, including ones with trailing paths like /photo/1
+_TWEET_ID_RE = re.compile(r'https://(?:twitter\.com|x\.com)/.*/status/(\d+)')
+
 
 def extract_post_id_from_url(url):
     """Extract Twitter post ID from URL including complex URLs with /photo/1."""
     if not url:
         return None
-
-    # Handle various Twitter/X URL formats
-    patterns = [
-        r'https://(twitter\.com|x\.com)/.*/status/(\d+)',  # Basic status URL
-        r'https://(twitter\.com|x\.com)/.*/status/(\d+)/.*',  # Status with additional paths like /photo/1
-    ]
-
-    for pattern in patterns:
-        match = re.match(pattern, url)
-        if match:
-            return match.group(2)
-
-    return None
+    match = _TWEET_ID_RE.match(url)
+    return match.group(1) if match else None
 
 def generate_token_details_from_post_id(post_id):
     """Generate token symbol and name from Twitter post ID."""
@@ -610,6 +808,7 @@ def launchpad():
     }
     errors = {}
     confirm_preview = False
+    status = 200
 
     # Prefill from query param q on GET
     if request.method == "GET":
@@ -645,131 +844,94 @@ def launchpad():
             errors["name"] = "Name is required"
 
         if errors:
-            for msg in errors.values():
-                flash(msg, "error")
-            return render_template("launchpad.html", form=form, errors=errors, confirm_preview=False), 400
-
-        # If not confirmed yet, show preview to confirm
-        if not confirm_flag:
+            status = 400
+        elif not confirm_flag:
+            # If not confirmed yet, show preview to confirm
             confirm_preview = True
-            return render_template("launchpad.html", form=form, errors=errors, confirm_preview=confirm_preview), 200
-
-        # Confirmed: create token with fixed parameters
-        symbol = form["symbol"]
-        name = form["name"]
-        post_url = form["post_url"]
-        post_id = extract_post_id_from_url(post_url)
-
-        token = Token.query.filter_by(symbol=symbol).first()
-        if token is not None:
+        # Existence check only (no row hydration); case-insensitive regardless of DB collation
+        elif db.session.query(exists().where(func.upper(Token.symbol) == form["symbol"].upper())).scalar():
             errors["symbol"] = "Token with this symbol already exists"
-            for msg in errors.values():
-                flash(msg, "error")
-            return render_template("launchpad.html", form=form, errors=errors, confirm_preview=False), 400
-
-        try:
-            # Create token with fixed supply
-            token = Token(symbol=symbol, name=name)
-            db.session.add(token)
-            db.session.flush()  # Get token ID
-
-            # Create token info with Twitter details
-            info = TokenInfo(
-                token_id=token.id,
-                total_supply=Decimal("1000000000"),  # 1 billion tokens
-                tweet_url=post_url,
-                tweet_author=f"Tweet Author {post_id[:4]}",  # Placeholder
-                tweet_content=f"Tokenized tweet {post_id}",  # Placeholder
-                tweet_created_at=datetime.utcnow(),
-                launch_user_id=g.jwt_payload.get("uid"),
-                launch_at=datetime.utcnow(),
-            )
-            db.session.add(info)
-
-            # Commit the token creation
-            db.session.commit()
-
-            # Invalidate caches affected by launches
+            status = 400
+        else:
+            # Confirmed: create token with fixed parameters
+            symbol = form["symbol"]
+            name = form["name"]
+            post_url = form["post_url"]
+            post_id = extract_post_id_from_url(post_url)
             try:
-                cache.delete_memoized(tokens_list)
-                cache.delete_memoized(explore)
-                cache.delete_memoized(pro)
-                cache.delete_memoized(stats)
-                cache.delete_memoized(_cached_recent_launches)
-                cache.delete_memoized(_cached_top_creators)
-                cache.delete_memoized(_cached_stats)
-                cache.delete_memoized(_cached_trending_items)
-            except Exception:
-                pass
-
-            flash("Token created successfully!", "success")
-            return redirect(url_for("web.tokens.token_detail", symbol=symbol, launched=1))
-
-        except Exception as e:
-            db.session.rollback()
-            current_app.logger.error(f"Failed to create token: {e}")
-            flash("Failed to create token", "error")
-            return render_template("launchpad.html", form=form, errors=errors, confirm_preview=False), 500
+                # Create token with fixed supply
+                token = Token(symbol=symbol, name=name)
+                db.session.add(token)
+                db.session.flush()  # Get token ID
+
+                # Create token info with Twitter details
+                info = TokenInfo(
+                    token_id=token.id,
+                    total_supply=Decimal("1000000000"),  # 1 billion tokens
+                    tweet_url=post_url,
+                    tweet_author=f"Tweet Author {post_id[:4]}",  # Placeholder
+                    tweet_content=f"Tokenized tweet {post_id}",  # Placeholder
+                    tweet_created_at=datetime.utcnow(),
+                    launch_user_id=g.jwt_payload.get("uid"),
+                    launch_at=datetime.utcnow(),
+                )
+                db.session.add(info)
+
+                # Commit the token creation
+                db.session.commit()
+                notify("launches")
+
+                # Invalidate caches affected by launches
+                try:
+                    _bump_tokens_cache_version()
+                    cache.delete_memoized(cached_recent_launches)
+                    cache.delete_memoized(cached_top_creators)
+                    cache.delete_memoized(cached_stats)
+                    cache.delete_memoized(cached_trending_items)
+                    cache.delete_memoized(_top_categories)
+                    cache.delete_memoized(_visible_token_rows)
+                    cache.delete_memoized(cached_homepage_sections)
+                except Exception:
+                    pass
 
-    return render_template("launchpad.html", form=form, errors=errors, confirm_preview=confirm_preview)
+                flash("Token created successfully!", "success")
+                return redirect(url_for("web.tokens.token_detail", symbol=symbol, launched=1))
 
+            except Exception as e:
+                db.session.rollback()
+                current_app.logger.error(f"Failed to create token: {e}")
+                flash("Failed to create token", "error")
+                status = 500
 
-# Pro scanner page
-def _compute_token_metrics(t: Token):
-    """Compute mock scanner metrics deterministically from token fields."""
-    # Basic deterministic seed from symbol
-    s = sum(ord(c) for c in (t.symbol or "")) or 1
-    price = float(t.price or 0) or 0.0
-    mcap = float(t.market_cap or 0) or 0.0
-    ch = float(t.change_24h or 0) or 0.0
-    twitter_score = int((s * 7 + int(price * 3)) % 100)
-    mentions = int((s * 13 + int(mcap) // 1000) % 1000)
-    sentiment = round(((s % 200) - 100) / 100.0, 2)  # -1.00 .. 1.00
-    risk = "low" if ch >= 0 else ("medium" if ch > -2 else "high")
-    trending = (s % 2) == 0 or ch > 2
-    vol_24h = round((mcap * (abs(ch) / 100.0)) if mcap > 0 else (price * 1000), 2)
-    return {
-        "token": t,
-        "twitterScore": twitter_score,
-        "mentions": mentions,
-        "sentiment": sentiment,
-        "risk": risk,
-        "trending": trending,
-        "vol_24h": vol_24h,
-    }
+        for msg in errors.values():
+            flash(msg, "error")
 
+    return render_template("launchpad.html", form=form, errors=errors, confirm_preview=confirm_preview), status
 
-@tokens_bp.route("/pro")
-@cache.cached(timeout=60, query_string=True)
-def pro():
-    sort = request.args.get("sort", default="market_cap", type=str)
-    order = request.args.get("order", default="desc", type=str)
-    risk_filter = request.args.get("risk", default="all", type=str)
-    trending_only = request.args.get("trending", default="0", type=str) == "1"
 
-    qry = Token.query
-    # Exclude hidden tokens and those moderated as hidden
-    try:
-        qry = qry.outerjoin(TokenInfo, TokenInfo.token_id == Token.id)
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
-        qry = qry.filter((TokenInfo.moderation_status == None) | (TokenInfo.moderation_status != 'hidden'))  # noqa: E711
-    except Exception:
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
-    tokens = qry.order_by(
-        case((Token.market_cap == None, 1), else_=0),  # noqa: E711
-        Token.market_cap.desc(),
-    ).all()
-    items = [_compute_token_metrics(t) for t in tokens]
-    # AMM prices for display
-    price_by_symbol = {t.symbol: (_amm_price_for_token(t) or float(t.price or 0)) for t in tokens if t and t.symbol}
-
-    # Filter
-    if trending_only:
-        items = [it for it in items if it["trending"]]
-    if risk_filter in {"low", "medium", "high"}:
-        items = [it for it in items if it["risk"] == risk_filter]
-
-    # Sort map
+def _pro_sql_query(qry, sort: str, order: str, risk_filter: str, trending_only: bool):
+    """Order (and risk-filter) the scanner query in SQL for column sorts; None when metrics must be sorted in Python."""
+    sort_col = {
+        "market_cap": Token.market_cap,
+        "price": Token.price,
+        "change_24h": Token.change_24h,
+    }.get(sort)
+    if sort_col is None or trending_only:
+        return None
+    # Risk buckets are a function of change_24h alone, matching _metrics_core
+    ch = func.coalesce(Token.change_24h, 0)
+    if risk_filter == "low":
+        qry = qry.filter(ch >= 0)
+    elif risk_filter == "medium":
+        qry = qry.filter(ch < 0, ch > -2)
+    elif risk_filter == "high":
+        qry = qry.filter(ch <= -2)
+    key = func.coalesce(sort_col, 0)
+    return qry.order_by(key.asc() if order == "asc" else key.desc(), Token.id.asc())
+
+
+def _pro_sort_key(sort: str):
+    """Python sort key over scanner metric items, for sorts that SQL cannot express."""
     def mcap_or_zero(it):
         v = it["token"].market_cap
         return float(v) if v is not None else 0.0
@@ -794,9 +956,78 @@ def pro():
         "risk": lambda it: risk_rank.get(it["risk"], 0),
         "trending": lambda it: 1 if it["trending"] else 0,
     }
-    key_fn = key_map.get(sort, mcap_or_zero)
-    reverse = order != "asc"
-    items.sort(key=key_fn, reverse=reverse)
+    return key_map.get(sort, mcap_or_zero)
+
+
+# Pro scanner page
+@lru_cache(maxsize=4096)
+def _metrics_core(symbol: str, price: float, mcap: float, ch: float) -> dict:
+    """Pure part of the scanner metrics; the returned dict is shared, never mutate it."""
+    # Basic deterministic seed from symbol
+    s = sum(ord(c) for c in (symbol or "")) or 1
+    return {
+        "twitterScore": int((s * 7 + int(price * 3)) % 100),
+        "mentions": int((s * 13 + int(mcap) // 1000) % 1000),
+        "sentiment": round(((s % 200) - 100) / 100.0, 2),  # -1.00 .. 1.00
+        "risk": "low" if ch >= 0 else ("medium" if ch > -2 else "high"),
+        "trending": (s % 2) == 0 or ch > 2,
+        "vol_24h": round((mcap * (abs(ch) / 100.0)) if mcap > 0 else (price * 1000), 2),
+    }
+
+
+def _compute_token_metrics(t: Token):
+    """Compute mock scanner metrics deterministically from token fields."""
+    core = _metrics_core(
+        t.symbol or "",
+        float(t.price or 0) or 0.0,
+        float(t.market_cap or 0) or 0.0,
+        float(t.change_24h or 0) or 0.0,
+    )
+    return {"token": t, **core}
+
+
+@tokens_bp.route("/pro")
+@cache.cached(timeout=60, make_cache_key=_tokens_view_cache_key)
+def pro():
+    sort = request.args.get("sort", default="market_cap", type=str)
+    order = request.args.get("order", default="desc", type=str)
+    risk_filter = request.args.get("risk", default="all", type=str)
+    trending_only = request.args.get("trending", default="0", type=str) == "1"
+    page = request.args.get("page", default=1, type=int)
+    per = request.args.get("per", default=48, type=int)
+    if page < 1:
+        page = 1
+    if per < 1:
+        per = 48
+
+    qry = Token.query
+    # Exclude hidden tokens and those moderated as hidden
+    qry = _visible_tokens(qry)
+
+    # Column sorts (and the change-based risk filter) run in SQL and only the page is loaded;
+    # synthetic metric sorts still need every token's metrics.
+    sql_qry = _pro_sql_query(qry, sort, order, risk_filter, trending_only)
+    if sql_qry is not None:
+        total = _cached_count(sql_qry.order_by(None), "pro", risk_filter)
+        tokens = sql_qry.limit(per).offset((page - 1) * per).all()
+        items = [_compute_token_metrics(t) for t in tokens]
+    else:
+        tokens = qry.order_by(*_order_nulls_last(Token.market_cap, "desc")).all()
+        items = [_compute_token_metrics(t) for t in tokens]
+
+        # Filter
+        if trending_only:
+            items = [it for it in items if it["trending"]]
+        if risk_filter in {"low", "medium", "high"}:
+            items = [it for it in items if it["risk"] == risk_filter]
+
+        items.sort(key=_pro_sort_key(sort), reverse=order != "asc")
+        total = len(items)
+        items = items[(page - 1) * per: page * per]
+
+    pages = (total + per - 1) // per if per else 1
+    # AMM prices for display (page only)
+    price_by_symbol = _price_by_symbol([it["token"] for it in items])
 
     return render_template(
         "pro.html",
@@ -805,6 +1036,10 @@ def pro():
         order=order,
         risk=risk_filter,
         trending="1" if trending_only else "0",
+        page=page,
+        per=per,
+        total=total,
+        pages=pages,
         price_by_symbol=price_by_symbol,
         meta_title="Pro Scanner — Postfun",
         meta_description="Deep-dive token scanner with risk, sentiment and trends on Postfun.",
@@ -827,6 +1062,7 @@ def watchlist():
     qry = (
         WatchlistItem.query.filter_by(user_id=user.id)
         .join(Token, WatchlistItem.token_id == Token.id)
+        .options(contains_eager(WatchlistItem.token))
     )
     if q:
         like = f"%{q}%"
@@ -839,25 +1075,13 @@ def watchlist():
         "name": Token.name,
     }.get(sort, Token.market_cap)
     if order == "asc":
-        qry = qry.order_by(
-            case((sort_col == None, 1), else_=0),  # noqa: E711
-            sort_col.asc(),
-        )
+        qry = qry.order_by(*_order_nulls_last(sort_col, "asc"))
     else:
-        qry = qry.order_by(
-            case((sort_col == None, 1), else_=0),  # noqa: E711
-            sort_col.desc(),
-        )
+        qry = qry.order_by(*_order_nulls_last(sort_col, "desc"))
     items = qry.all()
-    # Extract tokens from items for price map
-    tokens = []
-    for it in items:
-        try:
-            if it.token:
-                tokens.append(it.token)
-        except Exception:
-            pass
-    price_by_symbol = {t.symbol: (_amm_price_for_token(t) or float(t.price or 0)) for t in tokens if t and t.symbol}
+    # Tokens are populated from the joined rows; the inner join guarantees one per item
+    tokens = [it.token for it in items]
+    price_by_symbol = _price_by_symbol(tokens)
     return render_template(
         "watchlist.html",
         items=items,
@@ -880,18 +1104,23 @@ def watchlist_add(symbol: str):
     user = db.session.get(User, uid) if isinstance(uid, int) else None
     if not user:
         return redirect(url_for("web.main.home"))
-    token = Token.query.filter_by(symbol=symbol).first()
-    if not token:
-        abort(404)
-    exists = WatchlistItem.query.filter_by(user_id=user.id, token_id=token.id).first()
-    if not exists:
-        db.session.add(WatchlistItem(user_id=user.id, token_id=token.id))
-        try:
-            db.session.commit()
+    # One INSERT ... SELECT that resolves the symbol and skips existing rows (portable across SQLite/MariaDB)
+    already = exists().where(WatchlistItem.user_id == user.id, WatchlistItem.token_id == Token.id)
+    stmt = insert(WatchlistItem).from_select(
+        ["user_id", "token_id"],
+        select(literal(user.id), Token.id).where(Token.symbol == symbol, ~already),
+    )
+    try:
+        added = db.session.execute(stmt).rowcount
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        flash("Could not add to watchlist", "error")
+    else:
+        if added:
             flash(f"Added {symbol} to your watchlist", "success")
-        except Exception:
-            db.session.rollback()
-            flash("Could not add to watchlist", "error")
+        elif not db.session.query(exists().where(Token.symbol == symbol)).scalar():
+            abort(404)
     next_url = request.args.get("next") or url_for("web.tokens.token_detail", symbol=symbol)
     return redirect(next_url)
 
@@ -904,18 +1133,21 @@ def watchlist_remove(symbol: str):
     user = db.session.get(User, uid) if isinstance(uid, int) else None
     if not user:
         return redirect(url_for("web.main.home"))
-    token = Token.query.filter_by(symbol=symbol).first()
-    if not token:
-        abort(404)
-    item = WatchlistItem.query.filter_by(user_id=user.id, token_id=token.id).first()
-    if item:
-        try:
-            db.session.delete(item)
-            db.session.commit()
+    stmt = delete(WatchlistItem).where(
+        WatchlistItem.user_id == user.id,
+        WatchlistItem.token_id.in_(select(Token.id).where(Token.symbol == symbol)),
+    )
+    try:
+        removed = db.session.execute(stmt).rowcount
+        db.session.commit()
+    except Exception:
+        db.session.rollback()
+        flash("Could not remove from watchlist", "error")
+    else:
+        if removed:
             flash(f"Removed {symbol} from your watchlist", "success")
-        except Exception:
-            db.session.rollback()
-            flash("Could not remove from watchlist", "error")
+        elif not db.session.query(exists().where(Token.symbol == symbol)).scalar():
+            abort(404)
     next_url = request.args.get("next") or url_for("web.tokens.token_detail", symbol=symbol)
     return redirect(next_url)
 
@@ -929,30 +1161,27 @@ def alerts():
     user = db.session.get(User, uid) if isinstance(uid, int) else None
     if not user:
         return redirect(url_for("web.main.home"))
+    # Rules and events carry their tokens from the joins, so the template never lazy-loads
     rules = (
         AlertRule.query.filter_by(user_id=user.id)
         .join(Token, AlertRule.token_id == Token.id)
+        .options(contains_eager(AlertRule.token))
         .order_by(AlertRule.created_at.desc())
         .all()
     )
     # recent events (limit 50)
     events = (
         AlertEvent.query.join(AlertRule, AlertEvent.rule_id == AlertRule.id)
+        .join(Token, AlertRule.token_id == Token.id)
+        .options(contains_eager(AlertEvent.rule).contains_eager(AlertRule.token))
         .filter(AlertRule.user_id == user.id)
         .order_by(AlertEvent.triggered_at.desc())
         .limit(50)
         .all()
     )
-    # tokens for convenience in a select control
+    # tokens for convenience in a select control (symbol/name only)
     # Limit available tokens to non-hidden/non-moderated hidden
-    t_qry = Token.query
-    try:
-        t_qry = t_qry.outerjoin(TokenInfo, TokenInfo.token_id == Token.id)
-        t_qry = t_qry.filter((Token.hidden == False))  # noqa: E712
-        t_qry = t_qry.filter((TokenInfo.moderation_status == None) | (TokenInfo.moderation_status != 'hidden'))  # noqa: E711
-    except Exception:
-        t_qry = t_qry.filter((Token.hidden == False))  # noqa: E712
-    tokens = t_qry.order_by(Token.symbol.asc()).all()
+    tokens = _visible_tokens(Token.query).with_entities(Token.symbol, Token.name).order_by(Token.symbol.asc()).all()
     return render_template(
         "alerts.html",
         user=user,
@@ -1026,37 +1255,80 @@ def alerts_delete(rule_id: int):
 
 
 # Export routes
-@tokens_bp.route("/export/tokens.csv")
-def export_tokens_csv():
-    # Export basic token data as CSV
-    qry = Token.query
-    # Exclude hidden tokens and those moderated as hidden
-    try:
-        qry = qry.outerjoin(TokenInfo, TokenInfo.token_id == Token.id)
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
-        qry = qry.filter((TokenInfo.moderation_status == None) | (TokenInfo.moderation_status != 'hidden'))  # noqa: E711
-    except Exception:
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
-    tokens = qry.order_by(
-        case((Token.market_cap == None, 1), else_=0),  # noqa: E711
-        Token.market_cap.desc(),
-    ).all()
-    rows = ["symbol,name,price,market_cap,change_24h"]
-    for t in tokens:
-        rows.append(
-            f"{t.symbol},{t.name},{float(t.price or 0):.8f},{float(t.market_cap or 0):.2f},{float(t.change_24h or 0):.4f}"
+def _csv_chunks(header: list, rows, flush_every: int = 200):
+    """Write rows with csv.writer (quoting names that contain commas or quotes), yielding text every few hundred rows."""
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(header)
+    for n, row in enumerate(rows, 1):
+        writer.writerow(row)
+        if n % flush_every == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    yield buf.getvalue()
+
+
+class _TokenRow(NamedTuple):
+    """Plain, picklable stand-in for a Token carrying only the listed columns."""
+    id: int
+    symbol: str
+    name: str
+    price: Optional[float]
+    market_cap: Optional[float]
+    change_24h: Optional[float]
+
+
+@cache.memoize(timeout=60)
+def _visible_token_rows() -> list:
+    """Visible tokens ordered by market cap as plain rows, shared by the exports between refreshes."""
+    qry = _visible_tokens(Token.query).order_by(*_order_nulls_last(Token.market_cap, "desc"))
+    return [
+        _TokenRow(
+            tid,
+            symbol,
+            name,
+            float(price) if price is not None else None,
+            float(market_cap) if market_cap is not None else None,
+            float(change_24h) if change_24h is not None else None,
         )
-    csv_data = "\n".join(rows) + "\n"
+        for tid, symbol, name, price, market_cap, change_24h in qry.with_entities(*_TOKEN_LIST_COLUMNS)
+    ]
+
+
+_TOKEN_CSV_COLUMNS = (Token.symbol, Token.name, Token.price, Token.market_cap, Token.change_24h)
+
+
+def _token_csv_rows(rows):
+    """Basic token CSV from plain (symbol, name, price, market_cap, change_24h) tuples."""
+    return _csv_chunks(
+        ["symbol", "name", "price", "market_cap", "change_24h"],
+        (
+            [symbol, name, f"{float(price or 0):.8f}", f"{float(market_cap or 0):.2f}", f"{float(change_24h or 0):.4f}"]
+            for symbol, name, price, market_cap, change_24h in rows
+        ),
+    )
+
+
+def _csv_response(rows, filename: str, max_age: int) -> Response:
+    """Stream CSV lines as they are produced instead of joining the whole file in memory."""
     return Response(
-        csv_data,
+        stream_with_context(rows),
         mimetype="text/csv",
         headers={
-            "Content-Disposition": "attachment; filename=tokens.csv",
-            "Cache-Control": "public, max-age=300",
+            "Content-Disposition": f"attachment; filename={filename}",
+            "Cache-Control": f"public, max-age={max_age}",
         },
     )
 
 
+@tokens_bp.route("/export/tokens.csv")
+def export_tokens_csv():
+    # Export basic token data as CSV (visible tokens by market cap, from the shared row cache)
+    rows = ((t.symbol, t.name, t.price, t.market_cap, t.change_24h) for t in _visible_token_rows())
+    return _csv_response(_token_csv_rows(rows), "tokens.csv", max_age=300)
+
+
 @tokens_bp.route("/export/explore.csv")
 def export_explore_csv():
     # Mirror explore filters to export current view
@@ -1105,31 +1377,13 @@ def export_explore_csv():
         "change_24h": Token.change_24h,
     }.get(sort, Token.market_cap)
     if order == "asc":
-        qry = qry.order_by(
-            case((sort_col == None, 1), else_=0),  # noqa: E711
-            sort_col.asc(),
-        )
+        qry = qry.order_by(*_order_nulls_last(sort_col, "asc"))
     else:
-        qry = qry.order_by(
-            case((sort_col == None, 1), else_=0),  # noqa: E711
-            sort_col.desc(),
-        )
+        qry = qry.order_by(*_order_nulls_last(sort_col, "desc"))
 
-    tokens = qry.all()
-    rows = ["symbol,name,price,market_cap,change_24h"]
-    for t in tokens:
-        rows.append(
-            f"{t.symbol},{t.name},{float(t.price or 0):.8f},{float(t.market_cap or 0):.2f},{float(t.change_24h or 0):.4f}"
-        )
-    csv_data = "\n".join(rows) + "\n"
-    return Response(
-        csv_data,
-        mimetype="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=explore.csv",
-            "Cache-Control": "public, max-age=120",
-        },
-    )
+    # Column tuples straight from the cursor; no Token objects are built for the export
+    rows = qry.with_entities(*_TOKEN_CSV_COLUMNS).yield_per(500)
+    return _csv_response(_token_csv_rows(rows), "explore.csv", max_age=120)
 
 
 @tokens_bp.route("/export/pro.csv")
@@ -1139,96 +1393,62 @@ def export_pro_csv():
     risk_filter = request.args.get("risk", default="all", type=str)
     trending_only = request.args.get("trending", default="0", type=str) == "1"
 
-    qry = Token.query
+    qry = Token.query.options(load_only(*_TOKEN_LIST_COLUMNS))
     # Exclude hidden tokens and those moderated as hidden
-    try:
-        qry = qry.outerjoin(TokenInfo, TokenInfo.token_id == Token.id)
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
-        qry = qry.filter((TokenInfo.moderation_status == None) | (TokenInfo.moderation_status != 'hidden'))  # noqa: E711
-    except Exception:
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
-    tokens = qry.order_by(
-        case((Token.market_cap == None, 1), else_=0),  # noqa: E711
-        Token.market_cap.desc(),
-    ).all()
-    items = [_compute_token_metrics(t) for t in tokens]
-    if trending_only:
-        items = [it for it in items if it["trending"]]
-    if risk_filter in {"low", "medium", "high"}:
-        items = [it for it in items if it["risk"] == risk_filter]
-
-    def mcap_or_zero(it):
-        v = it["token"].market_cap
-        return float(v) if v is not None else 0.0
-
-    def price_or_zero(it):
-        v = it["token"].price
-        return float(v) if v is not None else 0.0
-
-    def change_or_zero(it):
-        v = it["token"].change_24h
-        return float(v) if v is not None else 0.0
-
-    risk_rank = {"high": 1, "medium": 2, "low": 3}
-    key_map = {
-        "market_cap": mcap_or_zero,
-        "price": price_or_zero,
-        "change_24h": change_or_zero,
-        "twitterScore": lambda it: it["twitterScore"],
-        "mentions": lambda it: it["mentions"],
-        "sentiment": lambda it: it["sentiment"],
-        "vol_24h": lambda it: it["vol_24h"],
-        "risk": lambda it: risk_rank.get(it["risk"], 0),
-        "trending": lambda it: 1 if it["trending"] else 0,
-    }
-    key_fn = key_map.get(sort, mcap_or_zero)
-    reverse = order != "asc"
-    items.sort(key=key_fn, reverse=reverse)
-
-    rows = [
-        "symbol,name,price,market_cap,change_24h,twitterScore,mentions,sentiment,risk,trending,vol_24h",
-    ]
-    for it in items:
-        t = it["token"]
-        rows.append(
-            f"{t.symbol},{t.name},{float(t.price or 0):.8f},{float(t.market_cap or 0):.2f},{float(t.change_24h or 0):.4f},{it['twitterScore']},{it['mentions']},{it['sentiment']},{it['risk']},{1 if it['trending'] else 0},{it['vol_24h']}"
-        )
-    csv_data = "\n".join(rows) + "\n"
-    return Response(
-        csv_data,
-        mimetype="text/csv",
-        headers={
-            "Content-Disposition": "attachment; filename=pro.csv",
-            "Cache-Control": "public, max-age=120",
-        },
+    qry = _visible_tokens(qry)
+    sql_qry = _pro_sql_query(qry, sort, order, risk_filter, trending_only)
+    if sql_qry is not None:
+        # Ordered and filtered in SQL: metrics are computed row by row as the CSV streams
+        items = (_compute_token_metrics(t) for t in sql_qry.yield_per(500))
+    else:
+        # Metric sorts need every token scored before the first row can be written
+        items = [_compute_token_metrics(t) for t in _visible_token_rows()]
+        if trending_only:
+            items = [it for it in items if it["trending"]]
+        if risk_filter in {"low", "medium", "high"}:
+            items = [it for it in items if it["risk"] == risk_filter]
+        items.sort(key=_pro_sort_key(sort), reverse=order != "asc")
+
+    header = ["symbol", "name", "price", "market_cap", "change_24h", "twitterScore", "mentions", "sentiment", "risk", "trending", "vol_24h"]
+    rows = (
+        [
+            it["token"].symbol,
+            it["token"].name,
+            f"{float(it['token'].price or 0):.8f}",
+            f"{float(it['token'].market_cap or 0):.2f}",
+            f"{float(it['token'].change_24h or 0):.4f}",
+            it["twitterScore"],
+            it["mentions"],
+            it["sentiment"],
+            it["risk"],
+            1 if it["trending"] else 0,
+            it["vol_24h"],
+        ]
+        for it in items
     )
+    return _csv_response(_csv_chunks(header, rows), "pro.csv", max_age=120)
 
 
 # Stats page
 @tokens_bp.route("/stats")
-@cache.cached(timeout=120)
+@cache.cached(timeout=120, make_cache_key=_tokens_view_cache_key)
 def stats():
     qry = Token.query
     # Exclude hidden tokens and those moderated as hidden
-    try:
-        qry = qry.outerjoin(TokenInfo, TokenInfo.token_id == Token.id)
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
-        qry = qry.filter((TokenInfo.moderation_status == None) | (TokenInfo.moderation_status != 'hidden'))  # noqa: E711
-    except Exception:
-        qry = qry.filter((Token.hidden == False))  # noqa: E712
-    tokens = qry.order_by(
-        case((Token.market_cap == None, 1), else_=0),  # noqa: E711
-        Token.market_cap.desc(),
-    ).all()
-    num_tokens = len(tokens)
-    prices = [float(t.price) for t in tokens if t.price is not None]
-    mcaps = [float(t.market_cap) for t in tokens if t.market_cap is not None]
-    avg_price = sum(prices) / len(prices) if prices else 0.0
-    avg_mcap = sum(mcaps) / len(mcaps) if mcaps else 0.0
-
-    top_by_mcap = tokens[:5]
-    gainers = sorted(tokens, key=lambda t: float(t.change_24h or 0.0), reverse=True)[:5]
-    losers = sorted(tokens, key=lambda t: float(t.change_24h or 0.0))[:5]
+    qry = _visible_tokens(qry)
+    # Aggregates in SQL (AVG skips NULLs, as the old per-row averages did); only 5-row lists are loaded
+    num_tokens, avg_price, avg_mcap = qry.with_entities(
+        func.count(Token.id), func.avg(Token.price), func.avg(Token.market_cap)
+    ).one()
+    avg_price = float(avg_price or 0.0)
+    avg_mcap = float(avg_mcap or 0.0)
+
+    by_mcap = _order_nulls_last(Token.market_cap, "desc")
+    top_by_mcap = qry.order_by(*by_mcap).limit(5).all()
+    # Top-k straight off the (hidden, change_24h) index; tokens without a 24h change are not movers
+    with_change = qry.filter(Token.change_24h.isnot(None))
+    gainers = with_change.order_by(Token.change_24h.desc(), Token.id.asc()).limit(5).all()
+    losers = with_change.order_by(Token.change_24h.asc(), Token.id.asc()).limit(5).all()
 
     # Volume leaders (24h): prefer OHLCCandle sums if present, fallback to metrics
     since = datetime.utcnow() - timedelta(days=1)
@@ -1240,28 +1460,45 @@ def stats():
         .limit(5)
         .all()
     )
-    token_by_id = {t.id: t for t in tokens}
+    vol_token_ids = {tid for tid, _ in vol_rows}
+    token_by_id = {t.id: t for t in qry.filter(Token.id.in_(vol_token_ids)).all()} if vol_token_ids else {}
     volume_leaders = []
     for tid, v in vol_rows:
         t = token_by_id.get(tid)
         if t:
             volume_leaders.append({"token": t, "vol_24h": float(v or 0)})
     if not volume_leaders:
-        # fallback using mock metrics
-        items = [_compute_token_metrics(t) for t in tokens]
-        items.sort(key=lambda it: it["vol_24h"], reverse=True)
-        for it in items[:5]:
+        # fallback using mock metrics; the vol_24h formula from _metrics_core ranks the rows in SQL
+        mcap = func.coalesce(Token.market_cap, 0)
+        change = func.coalesce(Token.change_24h, 0)
+        mock_vol = case(
+            (mcap > 0, mcap * func.abs(change) / 100),
+            else_=func.coalesce(Token.price, 0) * 1000,
+        )
+        for t in qry.order_by(mock_vol.desc(), *by_mcap).limit(5).all():
+            it = _compute_token_metrics(t)
             volume_leaders.append({"token": it["token"], "vol_24h": it["vol_24h"]})
 
-    # Stage leaders: highest current stage across pools
-    pools = SwapPool.query.all()
-    max_stage: dict[int, int] = {}
-    for p in pools:
-        max_stage[p.token_a_id] = max(int(p.stage or 1), max_stage.get(p.token_a_id, 1))
-        max_stage[p.token_b_id] = max(int(p.stage or 1), max_stage.get(p.token_b_id, 1))
-    stage_pairs = [(token_by_id.get(tid), stg) for tid, stg in max_stage.items() if token_by_id.get(tid)]
-    stage_pairs.sort(key=lambda pair: pair[1], reverse=True)
-    stage_leaders = [{"token": t, "stage": stg} for t, stg in stage_pairs[:5]]
+    # Stage leaders: highest current stage across pools, per token on either side of a pool
+    pool_stage = func.coalesce(SwapPool.stage, 1)
+    sides = db.session.query(
+        SwapPool.token_a_id.label("tid"), func.max(pool_stage).label("stg")
+    ).group_by(SwapPool.token_a_id).union_all(
+        db.session.query(SwapPool.token_b_id, func.max(pool_stage)).group_by(SwapPool.token_b_id)
+    ).subquery()
+    stage_by_token = (
+        db.session.query(sides.c.tid, func.max(sides.c.stg).label("stg"))
+        .group_by(sides.c.tid)
+        .subquery()
+    )
+    stage_rows = (
+        qry.join(stage_by_token, stage_by_token.c.tid == Token.id)
+        .add_columns(stage_by_token.c.stg)
+        .order_by(stage_by_token.c.stg.desc(), Token.id.asc())
+        .limit(5)
+        .all()
+    )
+    stage_leaders = [{"token": t, "stage": max(int(stg or 1), 1)} for t, stg in stage_rows]
 
     return render_template(
         "stats.html",
@@ -1280,6 +1517,20 @@ def stats():
 
 
 # SSE endpoints
+def _sse_load_options() -> tuple:
+    """raiseload('*') when SQLA_STRICT_LOADING is on, so a lazy load in an SSE loop fails loudly instead of N+1."""
+    if current_app.config.get("SQLA_STRICT_LOADING", "0") in ("1", "true", "True"):
+        return (raiseload("*"),)
+    return ()
+
+
+# SSE streams re-query as soon as a matching event is published; fallback_poll_seconds() is the
+# safety poll for writes that do not publish (admin edits, scripts, other workers without Redis)
+# and the keep-alive cadence.
+# Comment line SSE clients ignore; keeps proxies from timing the stream out
+_SSE_KEEPALIVE = b": keep-alive\n\n"
+
+
 @tokens_bp.route("/sse/prices")
 def sse_prices():
     symbol = request.args.get("symbol", type=str)
@@ -1291,6 +1542,9 @@ def sse_prices():
 
     def event_stream(sym: str):
         inc_sse("prices")
+        # Prices only move on trades
+        channels = ("trades",)
+        seen = wait_for_events(channels, None, 0)
         try:
             while True:
                 try:
@@ -1298,12 +1552,12 @@ def sse_prices():
                     # Use AMM-computed price when available for consistency
                     amm_price = _amm_price_for_token(t) if t else None
                     price = float(amm_price) if amm_price is not None else (float(t.price or 0) if t and t.price is not None else 0.0)
-                    data = json.dumps({"symbol": sym, "price": price})
-                    yield f"data: {data}\n\n"
+                    data = orjson.dumps({"symbol": sym, "price": price})
+                    yield b"data: " + data + b"\n\n"
                 except Exception:
                     # Heartbeat on errors to keep connection alive
-                    yield ": keep-alive\n\n"
-                time.sleep(5)
+                    yield _SSE_KEEPALIVE
+                seen = wait_for_events(channels, seen, timeout=fallback_poll_seconds())
         finally:
             dec_sse("prices")
 
@@ -1316,57 +1570,66 @@ def sse_prices():
 @tokens_bp.route("/sse/trades")
 def sse_trades():
     """Stream recent trades for the homepage ticker."""
-    def event_stream():
+    load_opts = _sse_load_options()
+
+    def event_stream(gusd_id: Optional[int]):
         last_ts = datetime.utcnow() - timedelta(minutes=10)
         inc_sse("trades")
+        channels = ("trades",)
+        seen = wait_for_events(channels, None, 0)
         try:
             while True:
                 try:
+                    # Trades arrive with their pool from the same join; tokens follow in one IN query
                     rows = (
-                        SwapTrade.query
+                        db.session.query(SwapTrade, SwapPool)
+                        .join(SwapPool, SwapTrade.pool_id == SwapPool.id)
+                        .options(*load_opts)
                         .filter(SwapTrade.created_at > last_ts)
                         .order_by(SwapTrade.created_at.asc())
                         .limit(100)
                         .all()
                     )
                     if rows:
-                        for t in rows:
+                        pool_token_ids = {tid for _, p in rows for tid in (p.token_a_id, p.token_b_id)}
+                        tokens = {
+                            tk.id: tk
+                            for tk in Token.query.options(*load_opts).filter(Token.id.in_(pool_token_ids)).all()
+                        }
+                        for t, pool in rows:
                             last_ts = max(last_ts, t.created_at)
-                            pool = db.session.get(SwapPool, t.pool_id)
-                            if not pool:
-                                continue
-                            gusd = _get_gusd_token()
                             token_id = None
-                            if gusd:
-                                token_id = pool.token_a_id if pool.token_b_id == gusd.id else pool.token_b_id
-                            tok = db.session.get(Token, token_id) if token_id else None
+                            if gusd_id:
+                                token_id = pool.token_a_id if pool.token_b_id == gusd_id else pool.token_b_id
+                            tok = tokens.get(token_id) if token_id else None
                             if not tok:
-                                tok = db.session.get(Token, pool.token_a_id)
+                                tok = tokens.get(pool.token_a_id)
                             recv_token_id = pool.token_b_id if t.side == "AtoB" else pool.token_a_id
                             kind = "buy" if (tok and recv_token_id == tok.id) else "sell"
                             pr = None
-                            if gusd:
-                                if pool.token_b_id == gusd.id:
+                            if gusd_id:
+                                if pool.token_b_id == gusd_id:
                                     pr = (t.amount_out / t.amount_in) if (t.side == "AtoB" and t.amount_in and t.amount_out) else ((t.amount_in / t.amount_out) if (t.amount_in and t.amount_out) else None)
-                                elif pool.token_a_id == gusd.id:
+                                elif pool.token_a_id == gusd_id:
                                     pr = (t.amount_in / t.amount_out) if (t.side == "AtoB" and t.amount_in and t.amount_out) else ((t.amount_out / t.amount_in) if (t.amount_in and t.amount_out) else None)
-                            data = json.dumps({
+                            data = orjson.dumps({
                                 "symbol": tok.symbol if tok else "?",
                                 "side": kind,
                                 "price": float(pr) if pr is not None else None,
                                 "time": t.created_at.isoformat() + "Z",
                             })
-                            yield f"data: {data}\n\n"
+                            yield b"data: " + data + b"\n\n"
                     else:
                         # Heartbeat to keep connection alive
-                        yield ": keep-alive\n\n"
+                        yield _SSE_KEEPALIVE
                 except Exception:
-                    yield ": keep-alive\n\n"
-                time.sleep(5)
+                    yield _SSE_KEEPALIVE
+                seen = wait_for_events(channels, seen, timeout=fallback_poll_seconds())
         finally:
             dec_sse("trades")
 
-    return Response(event_stream(), mimetype="text/event-stream", headers={
+    # Resolved once per stream rather than on every trade of every tick
+    return Response(event_stream(_get_gusd_token_id_cached()), mimetype="text/event-stream", headers={
         "Cache-Control": "no-cache",
         "X-Accel-Buffering": "no",
     })
@@ -1380,6 +1643,7 @@ def sse_alerts():
     uid = payload.get("uid")
     if not isinstance(uid, int):
         abort(401)
+    load_opts = _sse_load_options()
 
     def event_stream(user_id: int):
         last_ts = datetime.utcnow() - timedelta(minutes=5)
@@ -1391,6 +1655,8 @@ def sse_alerts():
                     evs = (
                         AlertEvent.query.join(AlertRule, AlertEvent.rule_id == AlertRule.id)
                         .join(Token, AlertRule.token_id == Token.id)
+                        # Rule and token are already joined; populate them from the same rows
+                        .options(contains_eager(AlertEvent.rule).contains_eager(AlertRule.token), *load_opts)
                         .filter(AlertRule.user_id == user_id, AlertEvent.triggered_at > last_ts)
                         .order_by(AlertEvent.triggered_at.asc())
                         .limit(20)
@@ -1399,7 +1665,7 @@ def sse_alerts():
                     if evs:
                         for ev in evs:
                             last_ts = max(last_ts, ev.triggered_at)
-                            data = json.dumps({
+                            data = orjson.dumps({
                                 "symbol": ev.rule.token.symbol,
                                 "name": ev.rule.token.name,
                                 "condition": ev.rule.condition,
@@ -1407,11 +1673,11 @@ def sse_alerts():
                                 "price": float(ev.price or 0),
                                 "time": ev.triggered_at.isoformat() + "Z",
                             })
-                            yield f"data: {data}\n\n"
+                            yield b"data: " + data + b"\n\n"
                     else:
-                        yield ": keep-alive\n\n"
+                        yield _SSE_KEEPALIVE
                 except Exception:
-                    yield ": keep-alive\n\n"
+                    yield _SSE_KEEPALIVE
                 time.sleep(5)
         finally:
             dec_sse("alerts")
@@ -1428,8 +1694,9 @@ def sse_follow():
     if not payload or not isinstance(payload.get("uid"), int):
         abort(401)
     uid = int(payload["uid"])
+    load_opts = _sse_load_options()
 
-    def event_stream(me_id: int):
+    def event_stream(me_id: int, gusd_id: Optional[int]):
         last_ts = datetime.utcnow() - timedelta(minutes=10)
         # Cache followed creators and derived token_ids, refresh periodically to reduce DB load
         followed = []
@@ -1437,6 +1704,9 @@ def sse_follow():
         last_follow_refresh = datetime.utcnow() - timedelta(minutes=10)
         refresh_interval = timedelta(seconds=60)
         inc_sse("follow")
+        # Launches, plus trades since stage burns only happen during swaps
+        channels = ("launches", "trades")
+        seen = wait_for_events(channels, None, 0)
         try:
             while True:
                 try:
@@ -1448,22 +1718,30 @@ def sse_follow():
                         token_ids = [row[0] for row in db.session.query(TokenInfo.token_id).filter(TokenInfo.launch_user_id.in_(followed)).all()] if followed else []
                         last_follow_refresh = now
                     if not followed:
-                        yield ": keep-alive\n\n"
-                        time.sleep(5)
+                        yield _SSE_KEEPALIVE
+                        seen = wait_for_events(channels, seen, timeout=fallback_poll_seconds())
                         continue
                     emitted = False
                     # New launches by followed creators
                     launches = (
-                        TokenInfo.query
+                        TokenInfo.query.options(*load_opts)
                         .filter(TokenInfo.launch_user_id.in_(followed), TokenInfo.launch_at != None, TokenInfo.launch_at > last_ts)  # noqa: E711
                         .order_by(TokenInfo.launch_at.asc())
                         .limit(50)
                         .all()
                     )
+                    launch_tokens = {
+                        tk.id: tk
+                        for tk in Token.query.options(*load_opts).filter(Token.id.in_({info.token_id for info in launches})).all()
+                    } if launches else {}
+                    creator_ids = {info.launch_user_id for info in launches if info.launch_user_id}
+                    creators = {
+                        u.id: u for u in User.query.options(*load_opts).filter(User.id.in_(creator_ids)).all()
+                    } if creator_ids else {}
                     for info in launches:
-                        t = db.session.get(Token, info.token_id)
-                        creator = db.session.get(User, info.launch_user_id) if info.launch_user_id else None
-                        data = json.dumps({
+                        t = launch_tokens.get(info.token_id)
+                        creator = creators.get(info.launch_user_id) if info.launch_user_id else None
+                        data = orjson.dumps({
                             "type": "launch",
                             "symbol": t.symbol if t else None,
                             "name": t.name if t else None,
@@ -1471,7 +1749,7 @@ def sse_follow():
                             "creator_id": info.launch_user_id,
                             "creator": (creator.display_name or creator.npub or creator.pubkey_hex) if creator else None,
                         })
-                        yield f"data: {data}\n\n"
+                        yield b"data: " + data + b"\n\n"
                         last_ts = max(last_ts, info.launch_at or last_ts)
                         emitted = True
 
@@ -1481,202 +1759,53 @@ def sse_follow():
                         burns = (
                             db.session.query(BurnEvent, SwapPool)
                             .join(SwapPool, BurnEvent.pool_id == SwapPool.id)
+                            .options(*load_opts)
                             .filter(BurnEvent.created_at > last_ts)
                             .filter((SwapPool.token_a_id.in_(token_ids)) | (SwapPool.token_b_id.in_(token_ids)))
                             .order_by(BurnEvent.created_at.asc())
                             .limit(50)
                             .all()
                         )
+                        burn_token_ids = {tid for _, pool in burns for tid in (pool.token_a_id, pool.token_b_id)}
+                        burn_tokens = {
+                            tk.id: tk for tk in Token.query.options(*load_opts).filter(Token.id.in_(burn_token_ids)).all()
+                        } if burn_token_ids else {}
                         for ev, pool in burns:
                             # Determine display token (non-gUSD where possible)
-                            gusd = _get_gusd_token()
-                            tokA = db.session.get(Token, pool.token_a_id)
-                            tokB = db.session.get(Token, pool.token_b_id)
+                            tokA = burn_tokens.get(pool.token_a_id)
+                            tokB = burn_tokens.get(pool.token_b_id)
                             disp = tokA
-                            if gusd and tokA and tokA.id == gusd.id:
+                            if gusd_id and tokA and tokA.id == gusd_id:
                                 disp = tokB
-                            elif gusd and tokB and tokB.id == gusd.id:
+                            elif gusd_id and tokB and tokB.id == gusd_id:
                                 disp = tokA
-                            data = json.dumps({
+                            data = orjson.dumps({
                                 "type": "stage",
                                 "symbol": disp.symbol if disp else (tokA.symbol if tokA else None),
                                 "stage": int(ev.stage),
                                 "time": ev.created_at.isoformat() + "Z",
                             })
-                            yield f"data: {data}\n\n"
+                            yield b"data: " + data + b"\n\n"
                             last_ts = max(last_ts, ev.created_at or last_ts)
                             emitted = True
 
                     if not emitted:
-                        yield ": keep-alive\n\n"
+                        yield _SSE_KEEPALIVE
                 except Exception:
-                    yield ": keep-alive\n\n"
-                time.sleep(5)
+                    yield _SSE_KEEPALIVE
+                seen = wait_for_events(channels, seen, timeout=fallback_poll_seconds())
         finally:
             dec_sse("follow")
 
-    return Response(event_stream(uid), mimetype="text/event-stream", headers={
+    return Response(event_stream(uid, _get_gusd_token_id_cached()), mimetype="text/event-stream", headers={
         "Cache-Control": "no-cache",
         "X-Accel-Buffering": "no",
     })
 
 
-# Helper functions for caching (need to be accessible across the module)
-def _cached_trending_items():
-    from datetime import timedelta as _td
-    since = datetime.utcnow() - _td(days=1)
-    gusd = _get_gusd_token()
-    pools = SwapPool.query.order_by(SwapPool.id.asc()).all()
-    trending = []
-    for p in pools:
-        if not gusd or (p.token_a_id != gusd.id and p.token_b_id != gusd.id):
-            continue
-        vol = (
-            db.session.query(SwapTrade)
-            .filter(SwapTrade.pool_id == p.id, SwapTrade.created_at >= since)
-            .with_entities(db.func.coalesce(db.func.sum(SwapTrade.amount_in), 0))
-            .scalar()
-        )
-        token_id = p.token_a_id if p.token_b_id == gusd.id else p.token_b_id
-        tok = db.session.get(Token, token_id)
-        if not tok:
-            continue
-        if p.token_b_id == gusd.id:
-            price = (p.reserve_b / p.reserve_a) if p.reserve_a and p.reserve_b else None
-        else:
-            price = (p.reserve_a / p.reserve_b) if p.reserve_a and p.reserve_b else None
-        # stage progress
-        stg = int(p.stage or 1)
-        vol_a = float(p.cumulative_volume_a or 0)
-        thr1 = float(p.stage1_threshold) if getattr(p, "stage1_threshold", None) is not None else None
-        thr2 = float(p.stage2_threshold) if getattr(p, "stage2_threshold", None) is not None else None
-        thr3 = float(p.stage3_threshold) if getattr(p, "stage3_threshold", None) is not None else None
-        next_thr = None
-        if stg < 2:
-            next_thr = thr1
-        elif stg < 3:
-            next_thr = thr2
-        elif stg < 4:
-            next_thr = thr3
-        progress_pct = 100 if not next_thr else max(0, min(100, int(round((vol_a / float(next_thr)) * 100))))
-        trending.append({
-            "symbol": tok.symbol,
-            "name": tok.name,
-            "price": float(price) if price is not None else None,
-            "volume_24h": float(vol or 0),
-            "stage": int(p.stage or 1),
-            "fee_bps": p.current_fee_bps(),
-            "next_stage": (stg + 1) if next_thr else None,
-            "progress_pct": progress_pct,
-            "remaining_to_next": (float(next_thr) - vol_a) if next_thr else 0.0,
-        })
-    trending.sort(key=lambda x: x["volume_24h"], reverse=True)
-    return trending
-
-
-@cache.memoize(timeout=60)
-def _cached_recent_launches():
-    recent_launches = []
-    infos = (
-        TokenInfo.query.order_by(TokenInfo.launch_at.desc()).limit(12).all()
-    )
-    for info in infos:
-        tok = db.session.get(Token, info.token_id)
-        if not tok:
-            continue
-        recent_launches.append({
-            "symbol": tok.symbol,
-            "name": tok.name,
-            "logo_url": info.logo_url,
-            "launch_at": info.launch_at.isoformat() + "Z" if info.launch_at else None,
-        })
-    return recent_launches
-
-
-@cache.memoize(timeout=120)
-def _cached_top_creators():
-    top_creators = []
-    agg = (
-        db.session.query(TokenInfo.launch_user_id, db.func.count(TokenInfo.id).label("cnt"))
-        .filter(TokenInfo.launch_user_id != None)  # noqa: E711
-        .group_by(TokenInfo.launch_user_id)
-        .order_by(db.text("cnt DESC"))
-        .limit(5)
-        .all()
-    )
-    for uid, cnt in agg:
-        u = db.session.get(User, uid)
-        if not u:
-            continue
-        top_creators.append({
-            "user_id": u.id,
-            "npub": u.npub or u.pubkey_hex,
-            "count": int(cnt or 0),
-        })
-    return top_creators
-
-
-@cache.memoize(timeout=30)
-def _cached_stats():
-    tokens_count = Token.query.count()
-    pools_count = SwapPool.query.count()
-    creators_count = (
-        db.session.query(db.func.count(db.func.distinct(TokenInfo.launch_user_id)))
-        .filter(TokenInfo.launch_user_id != None)  # noqa: E711
-        .scalar()
-    ) or 0
-    since_24h = datetime.utcnow() - timedelta(days=1)
-    trades_24h = 0
-    volume_24h_gusd = 0.0
-    gusd = _get_gusd_token()
-    if gusd:
-        pools_gusd = SwapPool.query.filter(
-            (SwapPool.token_a_id == gusd.id) | (SwapPool.token_b_id == gusd.id)
-        ).all()
-        pool_ids = [p.id for p in pools_gusd]
-        if pool_ids:
-            rows = (
-                SwapTrade.query
-                .filter(SwapTrade.pool_id.in_(pool_ids), SwapTrade.created_at >= since_24h)
-                .order_by(SwapTrade.created_at.desc())
-                .all()
-            )
-            trades_24h = len(rows)
-            for t in rows:
-                pool = next((p for p in pools_gusd if p.id == t.pool_id), None)
-                if not pool:
-                    continue
-                if pool.token_b_id == gusd.id:
-                    if t.side == "AtoB":
-                        if t.amount_out:
-                            volume_24h_gusd += float(t.amount_out)
-                    else:
-                        if t.amount_in:
-                            volume_24h_gusd += float(t.amount_in)
-                elif pool.token_a_id == gusd.id:
-                    if t.side == "AtoB":
-                        if t.amount_in:
-                            volume_24h_gusd += float(t.amount_in)
-                    else:
-                        if t.amount_out:
-                            volume_24h_gusd += float(t.amount_out)
-    else:
-        trades_24h = SwapTrade.query.filter(SwapTrade.created_at >= since_24h).count()
-    watchlists_count = WatchlistItem.query.count()
-    return {
-        "tokens": int(tokens_count or 0),
-        "pools": int(pools_count or 0),
-        "creators": int(creators_count or 0),
-        "trades_24h": int(trades_24h or 0),
-        "volume_24h": float(volume_24h_gusd or 0.0),
-        "watchlists": int(watchlists_count or 0),
-    }
-
-
 # Short-cache fee summary builder for a pool (used on pool and token pages)
 @cache.memoize(timeout=5)
 def _fee_summary_for_pool_cached(pool_id: int):
-    from decimal import Decimal as _D
     pool = db.session.get(SwapPool, pool_id)
     if not pool:
         return None
@@ -1685,68 +1814,96 @@ def _fee_summary_for_pool_cached(pool_id: int):
     bps_c = int(rule.bps_creator if rule else 5000)
     bps_m = int(rule.bps_minter if rule else 3000)
     bps_t = int(rule.bps_treasury if rule else 2000)
-    fa = _D(pool.fee_accum_a or 0)
-    fb = _D(pool.fee_accum_b or 0)
-    def _allocs(bps: int):
-        return {"A": (fa * _D(bps) / _D(10000)), "B": (fb * _D(bps) / _D(10000))}
-    def _paid(entity: str):
-        rows = FeePayout.query.filter_by(pool_id=pool.id, entity=entity).all()
-        totA = _D("0"); totB = _D("0")
-        for p in rows:
-            if p.asset == "A": totA += _D(p.amount or 0)
-            elif p.asset == "B": totB += _D(p.amount or 0)
-        return {"A": totA, "B": totB}
+    # Everything below ends up as floats for display, so do the bps split in float
+    fa = float(pool.fee_accum_a or 0)
+    fb = float(pool.fee_accum_b or 0)
+    # Paid totals for every entity/asset in one grouped aggregate
+    paid = {ent: {"A": 0.0, "B": 0.0} for ent in ("creator", "minter", "treasury")}
+    rows = (
+        db.session.query(FeePayout.entity, FeePayout.asset, db.func.coalesce(db.func.sum(FeePayout.amount), 0))
+        .filter(FeePayout.pool_id == pool.id)
+        .group_by(FeePayout.entity, FeePayout.asset)
+        .all()
+    )
+    for ent, asset, total in rows:
+        if ent in paid and asset in ("A", "B"):
+            paid[ent][asset] = float(total or 0)
     summary = {}
     for ent, bps in (("creator", bps_c), ("minter", bps_m), ("treasury", bps_t)):
-        a = _allocs(bps); p = _paid(ent)
+        alloc_a = fa * bps / 10000
+        alloc_b = fb * bps / 10000
+        p = paid[ent]
         summary[ent] = {
-            "alloc": {"A": float(a["A"]), "B": float(a["B"])},
-            "paid": {"A": float(p["A"]), "B": float(p["B"])},
-            "pending": {"A": float(max(_D("0"), a["A"] - p["A"])), "B": float(max(_D("0"), a["B"] - p["B"]))},
+            "alloc": {"A": alloc_a, "B": alloc_b},
+            "paid": {"A": p["A"], "B": p["B"]},
+            "pending": {"A": max(0.0, alloc_a - p["A"]), "B": max(0.0, alloc_b - p["B"])},
         }
     return summary
 
 
 # Mock data generators
-def _mock_series(token: Token, points: int = 30):
-    """Generate a simple time/price series."""
-    base_price = float(token.price or 1.0) or 1.0
-    seed = sum(ord(c) for c in token.symbol)
-    now = datetime.utcnow()
-    series = []
+@lru_cache(maxsize=1024)
+def _mock_series_prices(symbol: str, base_price: float, points: int) -> tuple:
+    """Deterministic price path for `_mock_series`; only the timestamps depend on the clock."""
+    seed = sum(ord(c) for c in symbol)
+    prices = []
     p = base_price
     for i in range(points):
         # small deterministic drift
         delta = ((seed + i * 3) % 7 - 3) * 0.001
         p = max(0.0001, p * (1 + delta))
-        t = now - timedelta(minutes=(points - i) * 15)
-        series.append({"t": t.isoformat() + "Z", "price": round(p, 6)})
-    return series
+        prices.append(round(p, 6))
+    return tuple(prices)
+
+
+def _mock_series(token: Token, points: int = 30):
+    """Generate a simple time/price series."""
+    base_price = float(token.price or 1.0) or 1.0
+    prices = _mock_series_prices(token.symbol, base_price, points)
+    now = datetime.utcnow()
+    return [
+        {"t": (now - timedelta(minutes=(points - i) * 15)).isoformat() + "Z", "price": price}
+        for i, price in enumerate(prices)
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _mock_holder_rows(symbol: str, n: int) -> tuple:
+    seed = sum(ord(c) for c in symbol)
+    return tuple(
+        (i, f"npub1...{seed % 9999:04d}{i:02d}", round(((seed * i) % 1000) / 10 + 10, 4))
+        for i in range(1, n + 1)
+    )
 
 
 def _mock_holders(token: Token, n: int = 8):
-    seed = sum(ord(c) for c in token.symbol)
-    holders = []
-    for i in range(1, n + 1):
-        amt = ((seed * i) % 1000) / 10 + 10
-        holders.append({"rank": i, "address": f"npub1...{seed % 9999:04d}{i:02d}", "amount": round(amt, 4)})
-    return holders
+    # Fresh dicts per call so callers may mutate them without touching the cached rows
+    return [
+        {"rank": rank, "address": address, "amount": amount}
+        for rank, address, amount in _mock_holder_rows(token.symbol, n)
+    ]
 
 
-def _mock_swaps(token: Token, n: int = 10):
-    seed = sum(ord(c) for c in token.symbol)
-    now = datetime.utcnow()
-    swaps = []
+@lru_cache(maxsize=1024)
+def _mock_swap_rows(symbol: str, base_price: float, n: int) -> tuple:
+    seed = sum(ord(c) for c in symbol)
+    rows = []
     for i in range(n):
         side = "buy" if ((seed + i) % 2 == 0) else "sell"
         amount = ((seed + i * 7) % 500) / 10 + 1
-        price = float(token.price or 1.0) * (1 + (((seed + i) % 9) - 4) * 0.005)
-        ts = now - timedelta(minutes=i * 7)
-        swap_data = {
+        price = base_price * (1 + (((seed + i) % 9) - 4) * 0.005)
+        rows.append((side, round(amount, 4), round(price, 6)))
+    return tuple(rows)
+
+
+def _mock_swaps(token: Token, n: int = 10):
+    now = datetime.utcnow()
+    return [
+        {
             "side": side,
-            "amount": round(amount, 4),
-            "price": round(price, 6),
-            "time": ts.isoformat() + "Z",
+            "amount": amount,
+            "price": price,
+            "time": (now - timedelta(minutes=i * 7)).isoformat() + "Z",
         }
-        swaps.append(swap_data)
-    return swaps
\ No newline at end of file
+        for i, (side, amount, price) in enumerate(_mock_swap_rows(token.symbol, float(token.price or 1.0), n))
+    ]
\ No newline at end of file
@@ -3,11 +3,11 @@ from __future__ import annotations
 from functools import wraps
 from typing import Optional
 from decimal import Decimal, InvalidOperation
-from datetime import datetime, timedelta
 import json
 
 from flask import render_template, request, g, redirect, url_for, abort, flash, current_app
 from sqlalchemy import case, func
+from sqlalchemy.orm import joinedload
 
 from ...utils.jwt_utils import verify_jwt
 from ...extensions import db
@@ -20,6 +20,14 @@ from ...models import (
     TokenInfo,
 )
 from ...services.amm import execute_swap, quote_swap
+from ...services.events import notify
+# Memoized builders and the cached gUSD lookup live with the token pages; share them with trading
+from ..tokens.routes import (
+    _fee_summary_for_pool_cached,
+    _get_gusd_token,
+    _gusd_pool_for_token,
+    _invalidate_trade_caches,
+)
 
 from . import trading_bp
 
@@ -49,35 +57,6 @@ def require_auth_web(f):
     return wrapper
 
 
-def _get_gusd_token() -> Optional[Token]:
-    return Token.query.filter_by(symbol="GUSD").first() or Token.query.filter_by(symbol="gUSD").first()
-
-
-def _amm_price_for_token(token: Token) -> Optional[float]:
-    """Compute AMM price for token against gUSD if such a pool exists."""
-    gusd = _get_gusd_token()
-    if not gusd:
-        return None
-    pool = (
-        SwapPool.query.filter(
-            ((SwapPool.token_a_id == token.id) & (SwapPool.token_b_id == gusd.id))
-            | ((SwapPool.token_b_id == token.id) & (SwapPool.token_a_id == gusd.id))
-        ).first()
-    )
-    if not pool or not pool.reserve_a or not pool.reserve_b:
-        return None
-    try:
-        if pool.token_b_id == gusd.id:
-            pr = (pool.reserve_b / pool.reserve_a)
-        elif pool.token_a_id == gusd.id:
-            pr = (pool.reserve_a / pool.reserve_b)
-        else:
-            pr = None
-        return float(pr) if pr is not None else None
-    except Exception:
-        return None
-
-
 # Pool detail page
 @trading_bp.route("/pool/<symbol>")
 def pool(symbol: str):
@@ -87,12 +66,7 @@ def pool(symbol: str):
 
     # Find preferred pool paired with gUSD
     gusd = _get_gusd_token()
-    pool = None
-    if gusd:
-        pool = SwapPool.query.filter(
-            ((SwapPool.token_a_id == token.id) & (SwapPool.token_b_id == gusd.id))
-            | ((SwapPool.token_b_id == token.id) & (SwapPool.token_a_id == gusd.id))
-        ).first()
+    pool = _gusd_pool_for_token(token.id, gusd.id) if gusd else None
     if not pool:
         pool = SwapPool.query.filter((SwapPool.token_a_id == token.id) | (SwapPool.token_b_id == token.id)).first()
 
@@ -109,49 +83,53 @@ def pool(symbol: str):
     series = []
     if pool:
         rows = (
-            SwapTrade.query.filter_by(pool_id=pool.id)
+            db.session.query(
+                SwapTrade.id,
+                SwapTrade.side,
+                SwapTrade.amount_in,
+                SwapTrade.amount_out,
+                SwapTrade.fee_paid,
+                SwapTrade.stage,
+                SwapTrade.created_at,
+            )
+            .filter(SwapTrade.pool_id == pool.id)
             .order_by(SwapTrade.created_at.desc())
             .limit(50)
             .all()
-        )
-        rows = list(reversed(rows))  # chronological
+        )[::-1]  # chronological
+        # Orientation is fixed per pool: gUSD-per-token is out/in when the trade direction
+        # matches "gUSD is token_b", in/out otherwise
+        gusd_is_b = bool(gusd and pool.token_b_id == gusd.id)
         for t in rows:
-            # price in gUSD per token
-            if gusd and pool.token_b_id == gusd.id:
-                if t.side == "AtoB":
-                    pr = (t.amount_out / t.amount_in) if t.amount_in and t.amount_out else None
-                else:
-                    pr = (t.amount_in / t.amount_out) if t.amount_in and t.amount_out else None
-            else:
-                # gUSD is token_a
-                if t.side == "AtoB":
-                    pr = (t.amount_in / t.amount_out) if t.amount_in and t.amount_out else None
-                else:
-                    pr = (t.amount_out / t.amount_in) if t.amount_in and t.amount_out else None
-            pt = {
+            amount_in = float(t.amount_in or 0)
+            amount_out = float(t.amount_out or 0)
+            pr = None
+            if amount_in and amount_out:
+                pr = amount_out / amount_in if (t.side == "AtoB") == gusd_is_b else amount_in / amount_out
+            trades.append({
                 "id": t.id,
                 "side": t.side,
-                "amount_in": float(t.amount_in or 0),
-                "amount_out": float(t.amount_out or 0),
+                "amount_in": amount_in,
+                "amount_out": amount_out,
                 "fee": float(t.fee_paid or 0),
                 "stage": int(t.stage or 1),
                 "created_at": t.created_at,
-                "price": float(pr) if pr is not None else None,
-            }
-            trades.append(pt)
+                "price": pr,
+            })
             if pr is not None:
-                series.append({"t": t.created_at.isoformat() + "Z", "price": float(pr)})
+                series.append({"t": t.created_at.isoformat() + "Z", "price": pr})
 
     # Top holders for this token
     holders = []
     rows = (
-        TokenBalance.query.filter(TokenBalance.token_id == token.id, TokenBalance.amount > 0)
+        db.session.query(TokenBalance, User)
+        .outerjoin(User, User.id == TokenBalance.user_id)
+        .filter(TokenBalance.token_id == token.id, TokenBalance.amount > 0)
         .order_by(TokenBalance.amount.desc())
         .limit(10)
         .all()
     )
-    for idx, r in enumerate(rows, start=1):
-        u = db.session.get(User, r.user_id)
+    for idx, (r, u) in enumerate(rows, start=1):
         address = (u.npub if (u and u.npub) else (u.pubkey_hex if u else f"user:{r.user_id}"))
         holders.append({"rank": idx, "address": address, "amount": float(r.amount or 0)})
 
@@ -168,9 +146,9 @@ def pool(symbol: str):
 
     # Creator (launcher) for this token
     launcher = None
-    info = TokenInfo.query.filter_by(token_id=token.id).first()
+    info = TokenInfo.query.options(joinedload(TokenInfo.launcher)).filter_by(token_id=token.id).first()
     if info and info.launch_user_id:
-        launcher = db.session.get(User, int(info.launch_user_id))
+        launcher = info.launcher
 
     # Fee summary for this pool (if exists)
     summary = None
@@ -205,12 +183,7 @@ def pool_trade(symbol: str):
     if not token:
         abort(404)
     gusd = _get_gusd_token()
-    pool = None
-    if gusd:
-        pool = SwapPool.query.filter(
-            ((SwapPool.token_a_id == token.id) & (SwapPool.token_b_id == gusd.id))
-            | ((SwapPool.token_b_id == token.id) & (SwapPool.token_a_id == gusd.id))
-        ).first()
+    pool = _gusd_pool_for_token(token.id, gusd.id) if gusd else None
     if not pool:
         flash("No pool available for this token", "error")
         return redirect(url_for("web.trading.pool", symbol=symbol))
@@ -277,7 +250,20 @@ def pool_trade(symbol: str):
 
         # Multi-pool routing: evaluate candidate pools to maximize output
         tok = token
-        candidates = SwapPool.query.filter((SwapPool.token_a_id == tok.id) | (SwapPool.token_b_id == tok.id)).all()
+        # One SELECT of just the columns quote_swap reads; quoting itself is pure Decimal math
+        candidates = (
+            db.session.query(
+                SwapPool.id,
+                SwapPool.token_a_id,
+                SwapPool.token_b_id,
+                SwapPool.reserve_a,
+                SwapPool.reserve_b,
+                SwapPool.stage,
+                SwapPool.fee_bps_base,
+            )
+            .filter((SwapPool.token_a_id == tok.id) | (SwapPool.token_b_id == tok.id))
+            .all()
+        )
         chosen = pool
         chosen_side = side
         best_out = None
@@ -309,11 +295,11 @@ def pool_trade(symbol: str):
             max_slippage_bps=max_slippage,
         )
         db.session.commit()
-        # Invalidate cached homepage sections affected by trades
+        # Wake SSE streams waiting on new trades (and any stage burns they caused)
+        notify("trades")
+        # Invalidate cached homepage sections affected by trades (throttled)
         try:
-            from ...extensions import cache
-            cache.delete_memoized(_cached_trending_items)
-            cache.delete_memoized(_cached_stats)
+            _invalidate_trade_caches()
         except Exception:
             pass
         flash("Trade executed", "success")
@@ -335,138 +321,3 @@ def pool_trade(symbol: str):
         flash(f"Trade failed: {e}", "error")
     return redirect(url_for("web.trading.pool", symbol=symbol))
 
-
-# Helper functions
-def _fee_summary_for_pool_cached(pool_id: int):
-    from decimal import Decimal as _D
-    pool = db.session.get(SwapPool, pool_id)
-    if not pool:
-        return None
-    rule = FeeDistributionRule.query.filter_by(pool_id=pool.id).first()
-    if rule:
-        bps_c = int(rule.bps_creator)
-        bps_m = int(rule.bps_minter)
-        bps_t = int(rule.bps_treasury)
-    else:
-        bps_c = 5000
-        bps_m = 3000
-        bps_t = 2000
-    fa = _D(pool.fee_accum_a or 0)
-    fb = _D(pool.fee_accum_b or 0)
-    def _allocs(bps: int):
-        return {"A": (fa * _D(bps) / _D(10000)), "B": (fb * _D(bps) / _D(10000))}
-    def _paid(entity: str):
-        rows = FeePayout.query.filter_by(pool_id=pool.id, entity=entity).all()
-        totA = _D("0"); totB = _D("0")
-        for p in rows:
-            if p.asset == "A": totA += _D(p.amount or 0)
-            elif p.asset == "B": totB += _D(p.amount or 0)
-        return {"A": totA, "B": totB}
-    summary = {}
-    for ent, bps in (("creator", bps_c), ("minter", bps_m), ("treasury", bps_t)):
-        a = _allocs(bps); p = _paid(ent)
-        summary[ent] = {
-            "alloc": {"A": float(a["A"]), "B": float(a["B"])},
-            "paid": {"A": float(p["A"]), "B": float(p["B"])},
-            "pending": {"A": float(max(_D("0"), a["A"] - p["A"])), "B": float(max(_D("0"), a["B"] - p["B"]))},
-        }
-    return summary
-
-
-def _cached_trending_items():
-    from datetime import timedelta as _td
-    since = datetime.utcnow() - _td(days=1)
-    gusd = _get_gusd_token()
-    pools = SwapPool.query.order_by(SwapPool.id.asc()).all()
-    trending = []
-    for p in pools:
-        if not gusd or (p.token_a_id != gusd.id and p.token_b_id != gusd.id):
-            continue
-        vol = (
-            db.session.query(SwapTrade)
-            .filter(SwapTrade.pool_id == p.id, SwapTrade.created_at >= since)
-            .with_entities(db.func.coalesce(db.func.sum(SwapTrade.amount_in), 0))
-            .scalar()
-        )
-        token_id = p.token_a_id if p.token_b_id == gusd.id else p.token_b_id
-        tok = db.session.get(Token, token_id)
-        if not tok:
-            continue
-        if p.token_b_id == gusd.id:
-            if p.reserve_a and p.reserve_b:
-                price = p.reserve_b / p.reserve_a
-            else:
-                price = None
-        else:
-            if p.reserve_a and p.reserve_b:
-                price = p.reserve_a / p.reserve_b
-            else:
-                price = None
-        trending.append({
-            "symbol": tok.symbol,
-            "name": tok.name,
-            "price": float(price) if price is not None else None,
-            "volume_24h": float(vol or 0),
-        })
-    trending.sort(key=lambda x: x["volume_24h"], reverse=True)
-    return trending
-
-
-def _cached_stats():
-    from datetime import timedelta
-    tokens_count = Token.query.count()
-    pools_count = SwapPool.query.count()
-    creators_count = (
-        db.session.query(db.func.count(db.func.distinct(TokenInfo.launch_user_id)))
-        .filter(TokenInfo.launch_user_id != None)  # noqa: E711
-        .scalar()
-    ) or 0
-    since_24h = datetime.utcnow() - timedelta(days=1)
-    trades_24h = 0
-    volume_24h_gusd = 0.0
-    gusd = _get_gusd_token()
-    if gusd:
-        pools_gusd = SwapPool.query.filter(
-            (SwapPool.token_a_id == gusd.id) | (SwapPool.token_b_id == gusd.id)
-        ).all()
-        pool_ids = [p.id for p in pools_gusd]
-        if pool_ids:
-            rows = (
-                SwapTrade.query
-                .filter(SwapTrade.pool_id.in_(pool_ids), SwapTrade.created_at >= since_24h)
-                .order_by(SwapTrade.created_at.desc())
-                .all()
-            )
-            trades_24h = len(rows)
-            for t in rows:
-                pool = next((p for p in pools_gusd if p.id == t.pool_id), None)
-                if not pool:
-                    continue
-                if pool.token_b_id == gusd.id:
-                    if t.side == "AtoB":
-                        if t.amount_out:
-                            volume_24h_gusd += float(t.amount_out)
-                    else:
-                        if t.amount_in:
-                            volume_24h_gusd += float(t.amount_in)
-                elif pool.token_a_id == gusd.id:
-                    if t.side == "AtoB":
-                        if t.amount_in:
-                            volume_24h_gusd += float(t.amount_in)
-                    else:
-                        if t.amount_out:
-                            volume_24h_gusd += float(t.amount_out)
-    else:
-        trades_24h = SwapTrade.query.filter(SwapTrade.created_at >= since_24h).count()
-    from ...models import WatchlistItem
-    watchlists_count = WatchlistItem.query.count()
-    # Build stats dictionary
-    stats_data = {
-        "tokens": int(tokens_count or 0),
-        "pools": int(pools_count or 0),
-        "creators": int(creators_count or 0),
-        "trades_24h": int(trades_24h or 0),
-        "volume_24h": float(volume_24h_gusd or 0.0),
-        "watchlists": int(watchlists_count or 0),
-    }
-    return stats_data
\ No newline at end of file
@@ -11,9 +11,12 @@ import base64
 import hashlib
 
 from flask import render_template, request, g, redirect, url_for, abort, flash, Response, current_app, session
-from sqlalchemy import case, func
+from sqlalchemy import case, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import contains_eager, joinedload, raiseload
 from requests_oauthlib import OAuth2Session
 import requests
+from requests.adapters import HTTPAdapter
 
 from ...utils.jwt_utils import verify_jwt
 from ...extensions import db, cache
@@ -30,6 +33,9 @@ from ...models import (
     LightningWithdrawal,
 )
 from ...services.amm import quote_swap
+# gUSD lookup and AMM price helpers are shared with the tokens routes (cached id, batched pool query)
+from ..tokens.routes import _amm_prices_for_tokens, _get_gusd_token, _price_by_symbol
+from ..utils import cached_trending_items, flush_trade_caches
 from flask import jsonify
 
 from . import users_bp
@@ -39,12 +45,16 @@ COOKIE_NAME = "pf_jwt"
 
 
 def get_jwt_from_cookie() -> Optional[dict]:
+    # Verify the cookie at most once per request (same cache key as the tokens routes)
+    if "jwt_payload_cached" in g:
+        return g.jwt_payload_cached
+    payload = None
     token = request.cookies.get(COOKIE_NAME)
-    if not token:
-        return None
-    ok, payload = verify_jwt(token)
-    if not ok:
-        return None
+    if token:
+        ok, decoded = verify_jwt(token)
+        if ok:
+            payload = decoded
+    g.jwt_payload_cached = payload
     return payload
 
 
@@ -60,45 +70,40 @@ def require_auth_web(f):
     return wrapper
 
 
-def _get_gusd_token():
-    from ...models import Token
-    return Token.query.filter_by(symbol="GUSD").first() or Token.query.filter_by(symbol="gUSD").first()
+def current_user(*options) -> Optional[User]:
+    """The signed-in user for this request, loaded once and kept on `g.current_user`.
 
+    `options` only apply to the first load, so pages that render relationships pass their loaders.
+    """
+    if "current_user" not in g:
+        payload = get_jwt_from_cookie()
+        uid = payload.get("uid") if payload else None
+        g.current_user = db.session.get(User, uid, options=options) if isinstance(uid, int) else None
+    return g.current_user
+
+
+def _twitter_connection_load():
+    """Loader option for pages that render a user's Twitter connection (one-to-one, so joined)."""
+    return joinedload(User.twitter_connection).joinedload(UserTwitterConnection.twitter_user)
 
-def _amm_price_for_token(token: Token) -> Optional[float]:
-    """Compute AMM price for token against gUSD if such a pool exists."""
-    gusd = _get_gusd_token()
-    if not gusd:
-        return None
-    pool = (
-        SwapPool.query.filter(
-            ((SwapPool.token_a_id == token.id) & (SwapPool.token_b_id == gusd.id))
-            | ((SwapPool.token_b_id == token.id) & (SwapPool.token_a_id == gusd.id))
-        ).first()
-    )
-    if not pool or not pool.reserve_a or not pool.reserve_b:
-        return None
-    try:
-        if pool.token_b_id == gusd.id:
-            pr = (pool.reserve_b / pool.reserve_a)
-        elif pool.token_a_id == gusd.id:
-            pr = (pool.reserve_a / pool.reserve_b)
-        else:
-            pr = None
-        return float(pr) if pr is not None else None
-    except Exception:
-        return None
+
+def _strict_loads(*options):
+    """Loader options for the heavy page queries, plus raiseload('*') when the app runs in debug.
+
+    Pages list the relationships they render explicitly; in development any other lazy load
+    (e.g. a new `.attr` access added to a template) raises instead of silently adding a query.
+    """
+    if current_app.debug:
+        return (*options, raiseload("*"))
+    return options
 
 
 # User profile routes
 @users_bp.route("/profile")
 @require_auth_web
 def user_profile():
-    payload = g.jwt_payload
-    uid = payload.get("uid")
-    user = None
-    if isinstance(uid, int):
-        user = db.session.get(User, uid)
+    # profile.html renders the connected Twitter account
+    user = current_user(*_strict_loads(_twitter_connection_load()))
     if not user:
         abort(404)
 
@@ -114,7 +119,7 @@ def user_profile_by_identifier(identifier: str):
 
     # Check if it's an npub (starts with 'npub1')
     if identifier.startswith("npub1"):
-        user = User.query.filter_by(npub=identifier).first()
+        user = User.query.options(*_strict_loads(_twitter_connection_load())).filter_by(npub=identifier).first()
         profile_type = "npub"
 
     # Check if it's a Twitter username (starts with '@')
@@ -123,10 +128,19 @@ def user_profile_by_identifier(identifier: str):
         twitter_user = TwitterUser.query.filter_by(username=twitter_username).first()
 
         if twitter_user:
-            # Find the connected user
-            connection = UserTwitterConnection.query.filter_by(twitter_user_id=twitter_user.id).first()
-            if connection:
-                user = connection.user
+            # Find the connected user, with its connection and Twitter user in the same query
+            user = (
+                User.query
+                .join(User.twitter_connection)
+                .options(
+                    *_strict_loads(
+                        contains_eager(User.twitter_connection).joinedload(UserTwitterConnection.twitter_user)
+                    )
+                )
+                .filter(UserTwitterConnection.twitter_user_id == twitter_user.id)
+                .first()
+            )
+            if user:
                 profile_type = "twitter"
             else:
                 # Twitter user exists but not connected to a platform user
@@ -137,32 +151,51 @@ def user_profile_by_identifier(identifier: str):
         abort(404)
 
     # Calculate user statistics (same as existing user_profile route)
-    total_trades = SwapTrade.query.filter_by(user_id=user.id).count()
-
-    # Calculate total volume in gUSD
     total_volume = 0
     gusd = _get_gusd_token()
     if gusd:
-        user_trades = SwapTrade.query.filter_by(user_id=user.id).all()
-        for trade in user_trades:
-            pool = SwapPool.query.get(trade.pool_id)
-            if pool:
-                if pool.token_a_id == gusd.id:
-                    total_volume += float(trade.amount_in if trade.side == "AtoB" else trade.amount_out)
-                elif pool.token_b_id == gusd.id:
-                    total_volume += float(trade.amount_out if trade.side == "AtoB" else trade.amount_in)
-
-    tokens_created = TokenInfo.query.filter_by(launch_user_id=user.id).count()
-    holdings_count = TokenBalance.query.filter_by(user_id=user.id, amount=0).count()
+        # Trade count and gUSD-side volume in one pass; non-gUSD pools count but add no volume
+        gusd_leg = case(
+            (
+                SwapPool.token_a_id == gusd.id,
+                case((SwapTrade.side == "AtoB", SwapTrade.amount_in), else_=SwapTrade.amount_out),
+            ),
+            (
+                SwapPool.token_b_id == gusd.id,
+                case((SwapTrade.side == "AtoB", SwapTrade.amount_out), else_=SwapTrade.amount_in),
+            ),
+            else_=None,
+        )
+        total_trades, volume = (
+            db.session.query(func.count(SwapTrade.id), func.sum(gusd_leg))
+            .outerjoin(SwapPool, SwapPool.id == SwapTrade.pool_id)
+            .filter(SwapTrade.user_id == user.id)
+            .one()
+        )
+        total_volume = float(volume or 0)
+    else:
+        total_trades = db.session.query(func.count(SwapTrade.id)).filter(SwapTrade.user_id == user.id).scalar()
+
+    # Launch count, non-zero holdings and holdings value in one round trip
+    launches_count = (
+        select(func.count(TokenInfo.id)).where(TokenInfo.launch_user_id == user.id).scalar_subquery()
+    )
+    tokens_created, holdings_count, value = (
+        db.session.query(
+            launches_count,
+            func.coalesce(func.sum(case((TokenBalance.amount > 0, 1), else_=0)), 0),
+            func.sum(TokenBalance.amount * Token.price),
+        )
+        .select_from(TokenBalance)
+        .outerjoin(Token, Token.id == TokenBalance.token_id)
+        .filter(TokenBalance.user_id == user.id)
+        .one()
+    )
 
     # Calculate portfolio value (simplified)
     portfolio_value = 0
     if gusd:
-        holdings = TokenBalance.query.filter_by(user_id=user.id).all()
-        for holding in holdings:
-            token = Token.query.get(holding.token_id)
-            if token and token.price:
-                portfolio_value += float(holding.amount) * float(token.price)
+        portfolio_value = float(value or 0)
 
     user_stats = {
         "total_trades": total_trades,
@@ -194,46 +227,65 @@ def creator_profile(user_id: int):
     if not user:
         abort(404)
     launches = TokenInfo.query.filter_by(launch_user_id=user.id).order_by(TokenInfo.launch_at.desc()).all()
-    tokens = []
-    for info in launches:
-        t = db.session.get(Token, info.token_id)
-        if t:
-            tokens.append(t)
-    price_by_symbol = {t.symbol: (_amm_price_for_token(t) or float(t.price or 0)) for t in tokens if t and t.symbol}
-    follower_count = CreatorFollow.query.filter_by(creator_user_id=user.id).count()
-    # follow status
-    is_following = False
-    payload = get_jwt_from_cookie()
-    if payload and isinstance(payload.get("uid"), int):
-        me = db.session.get(User, int(payload.get("uid")))
-        if me:
-            is_following = CreatorFollow.query.filter_by(follower_user_id=me.id, creator_user_id=user.id).first() is not None
+    launch_token_ids = {info.token_id for info in launches}
+    tokens_by_id = (
+        {t.id: t for t in Token.query.filter(Token.id.in_(launch_token_ids)).all()} if launch_token_ids else {}
+    )
+    tokens = [tokens_by_id[info.token_id] for info in launches if info.token_id in tokens_by_id]
+    price_by_symbol = _price_by_symbol(tokens)
+    # Follower count and the viewer's follow status in one aggregate
+    me = current_user()
+    me_id = me.id if me else None
+    follower_count, following = (
+        db.session.query(
+            func.count(CreatorFollow.id),
+            func.max(case((CreatorFollow.follower_user_id == me_id, 1), else_=0)),
+        )
+        .filter(CreatorFollow.creator_user_id == user.id)
+        .one()
+    )
+    is_following = bool(following)
 
     # Aggregate fee summary for this creator (based on rules assigning creator_user_id)
-    from decimal import Decimal as _D
     rules = FeeDistributionRule.query.filter_by(creator_user_id=user.id).all()
     total = {"allocA": 0.0, "allocB": 0.0, "paidA": 0.0, "paidB": 0.0, "pendingA": 0.0, "pendingB": 0.0}
     items = []
     gusd = _get_gusd_token()
+    # Pools, their tokens and the creator payouts each come back in one query
+    pool_ids = {r.pool_id for r in rules}
+    pools_by_id = {}
+    pool_tokens = {}
+    paid_by_pool_asset = {}
+    if pool_ids:
+        pools_by_id = {p.id: p for p in SwapPool.query.filter(SwapPool.id.in_(pool_ids)).all()}
+        pool_token_ids = {tid for p in pools_by_id.values() for tid in (p.token_a_id, p.token_b_id)}
+        if pool_token_ids:
+            pool_tokens = {t.id: t for t in Token.query.filter(Token.id.in_(pool_token_ids)).all()}
+        paid_by_pool_asset = {
+            (pool_id, asset): float(amount or 0)
+            for pool_id, asset, amount in (
+                db.session.query(FeePayout.pool_id, FeePayout.asset, func.sum(FeePayout.amount))
+                .filter(FeePayout.pool_id.in_(pool_ids), FeePayout.entity == "creator")
+                .group_by(FeePayout.pool_id, FeePayout.asset)
+                .all()
+            )
+        }
     for r in rules:
-        pool = db.session.get(SwapPool, r.pool_id)
+        pool = pools_by_id.get(r.pool_id)
         if not pool:
             continue
-        fa = _D(pool.fee_accum_a or 0); fb = _D(pool.fee_accum_b or 0)
+        # Display-only figures: float math, same as _fee_summary_for_pool_cached
         bps = int(r.bps_creator or 0)
-        allocA = fa * _D(bps) / _D(10000)
-        allocB = fb * _D(bps) / _D(10000)
+        allocA = float(pool.fee_accum_a or 0) * bps / 10000
+        allocB = float(pool.fee_accum_b or 0) * bps / 10000
         # paid for creator entity
-        rows = FeePayout.query.filter_by(pool_id=pool.id, entity="creator").all()
-        paidA = _D("0"); paidB = _D("0")
-        for p in rows:
-            if p.asset == "A": paidA += _D(p.amount or 0)
-            elif p.asset == "B": paidB += _D(p.amount or 0)
-        pendA = max(_D("0"), allocA - paidA)
-        pendB = max(_D("0"), allocB - paidB)
+        paidA = paid_by_pool_asset.get((pool.id, "A"), 0.0)
+        paidB = paid_by_pool_asset.get((pool.id, "B"), 0.0)
+        pendA = max(0.0, allocA - paidA)
+        pendB = max(0.0, allocB - paidB)
         # Figure display symbol (prefer non-gUSD token)
-        tokA = db.session.get(Token, pool.token_a_id)
-        tokB = db.session.get(Token, pool.token_b_id)
+        tokA = pool_tokens.get(pool.token_a_id)
+        tokB = pool_tokens.get(pool.token_b_id)
         disp_token = tokA
         if gusd and tokA and tokA.id == (gusd.id if gusd else -1):
             disp_token = tokB
@@ -242,13 +294,13 @@ def creator_profile(user_id: int):
         items.append({
             "pool_id": pool.id,
             "symbol": disp_token.symbol if disp_token else (tokA.symbol if tokA else '?'),
-            "allocA": float(allocA), "allocB": float(allocB),
-            "paidA": float(paidA), "paidB": float(paidB),
-            "pendingA": float(pendA), "pendingB": float(pendB),
+            "allocA": allocA, "allocB": allocB,
+            "paidA": paidA, "paidB": paidB,
+            "pendingA": pendA, "pendingB": pendB,
         })
-        total["allocA"] += float(allocA); total["allocB"] += float(allocB)
-        total["paidA"] += float(paidA); total["paidB"] += float(paidB)
-        total["pendingA"] += float(pendA); total["pendingB"] += float(pendB)
+        total["allocA"] += allocA; total["allocB"] += allocB
+        total["paidA"] += paidA; total["paidB"] += paidB
+        total["pendingA"] += pendA; total["pendingB"] += pendB
 
     meta_title = f"Creator — {user.npub or user.pubkey_hex} | Postfun"
     meta_url = url_for("web.users.creator_profile", user_id=user.id, _external=True)
@@ -270,9 +322,7 @@ def creator_profile(user_id: int):
 @users_bp.route("/creator/<int:user_id>/follow", methods=["POST"])
 @require_auth_web
 def creator_follow(user_id: int):
-    payload = g.jwt_payload
-    uid = payload.get("uid") if payload else None
-    me = db.session.get(User, uid) if isinstance(uid, int) else None
+    me = current_user()
     if not me:
         return redirect(url_for("web.main.home"))
     if me.id == user_id:
@@ -293,9 +343,7 @@ def creator_follow(user_id: int):
 @users_bp.route("/creator/<int:user_id>/unfollow", methods=["POST"])
 @require_auth_web
 def creator_unfollow(user_id: int):
-    payload = g.jwt_payload
-    uid = payload.get("uid") if payload else None
-    me = db.session.get(User, uid) if isinstance(uid, int) else None
+    me = current_user()
     if not me:
         return redirect(url_for("web.main.home"))
     row = CreatorFollow.query.filter_by(follower_user_id=me.id, creator_user_id=user_id).first()
@@ -315,11 +363,9 @@ def creator_unfollow(user_id: int):
 @require_auth_web
 def wallet():
     print(f"[DEBUG] Wallet route called at {datetime.utcnow()}")
-    payload = g.jwt_payload
-    uid = payload.get("uid")
-    user = db.session.get(User, uid) if isinstance(uid, int) else None
+    user = current_user()
     if not user:
-        print(f"[DEBUG] User {uid} not found, redirecting to home")
+        print(f"[DEBUG] User {g.jwt_payload.get('uid')} not found, redirecting to home")
         return redirect(url_for("web.main.home"))
 
     print(f"[DEBUG] NEW CODE VERSION - Found user {user.id}, processing invoices directly")
@@ -420,6 +466,7 @@ def wallet():
     balances = (
         TokenBalance.query
         .join(Token, TokenBalance.token_id == Token.id)
+        .options(*_strict_loads(contains_eager(TokenBalance.token)))
         .filter(TokenBalance.user_id == user.id, TokenBalance.amount > 0)
     )
 
@@ -429,26 +476,24 @@ def wallet():
 
     balances = balances.order_by(TokenBalance.amount.desc()).all()
 
-    # Calculate total balance and individual values
+    # AMM prices for every held token (and BTC) in one pool query
+    amm_prices = _amm_prices_for_tokens([b.token for b in balances] + ([btc_token] if btc_token else []))
+
+    # Single pass: per-balance value, running total and the price map
     total_balance = 0.0
+    price_by_symbol = {}
     for balance in balances:
-        price = _amm_price_for_token(balance.token) or float(balance.token.price or 0)
+        price = amm_prices.get(balance.token_id) or float(balance.token.price or 0)
         value = float(balance.amount or 0) * price
         balance.value = value
         total_balance += value
+        price_by_symbol[balance.token.symbol] = price
 
-    # Add BTC balance to total
-    if btc_token:
-        btc_price = _amm_price_for_token(btc_token) or float(btc_token.price or 0)
-        btc_value = wallet_summary['btc_balance'] * btc_price
-        total_balance += btc_value
-
-    # Get price map for tokens
-    price_by_symbol = {balance.token.symbol: (_amm_price_for_token(balance.token) or float(balance.token.price or 0)) for balance in balances}
-
-    # Add BTC price to map
+    # Add BTC balance to total and its price to the map
     if btc_token:
-        price_by_symbol['BTC'] = _amm_price_for_token(btc_token) or float(btc_token.price or 0)
+        btc_price = amm_prices.get(btc_token.id) or float(btc_token.price or 0)
+        total_balance += wallet_summary['btc_balance'] * btc_price
+        price_by_symbol['BTC'] = btc_price
 
     # Get lightning invoices from WalletService
     lightning_invoices = wallet_summary['recent_invoices']
@@ -480,12 +525,10 @@ def simple_withdraw():
     """Simple withdrawal without complex Nostr authentication"""
     print(f"[WITHDRAWAL DEBUG] Simple withdrawal called at {datetime.utcnow()}")
 
-    payload = g.jwt_payload
-    uid = payload.get("uid")
-    user = db.session.get(User, uid) if isinstance(uid, int) else None
+    user = current_user()
 
     if not user:
-        print(f"[WITHDRAWAL DEBUG] User {uid} not found")
+        print(f"[WITHDRAWAL DEBUG] User {g.jwt_payload.get('uid')} not found")
         return jsonify({"error": "user_not_found"}), 404
 
     try:
@@ -593,11 +636,7 @@ def simple_withdraw():
 @users_bp.route("/dashboard")
 @require_auth_web
 def dashboard():
-    payload = g.jwt_payload
-    uid = payload.get("uid")
-    user = None
-    if isinstance(uid, int):
-        user = db.session.get(User, uid)
+    user = current_user(*_strict_loads())
     # Counts
     wl_count = 0
     alerts_count = 0
@@ -606,38 +645,12 @@ def dashboard():
         wl_count = WatchlistItem.query.filter_by(user_id=user.id).count()
         alerts_count = AlertRule.query.filter_by(user_id=user.id).count()
 
-    # Trending by AMM 24h volume (gUSD pairs)
-    from datetime import timedelta as _td
-
-    trending = []
-    since = datetime.utcnow() - _td(days=1)
-    gusd = _get_gusd_token()
-    pools = SwapPool.query.order_by(SwapPool.id.asc()).all()
-    for p in pools:
-        if not gusd or (p.token_a_id != gusd.id and p.token_b_id != gusd.id):
-            continue
-        vol = (
-            db.session.query(SwapTrade)
-            .filter(SwapTrade.pool_id == p.id, SwapTrade.created_at >= since)
-            .with_entities(db.func.coalesce(db.func.sum(SwapTrade.amount_in), 0))
-            .scalar()
-        )
-        token_id = p.token_a_id if p.token_b_id == gusd.id else p.token_b_id
-        tok = db.session.get(Token, token_id)
-        if not tok:
-            continue
-        if p.token_b_id == gusd.id:
-            price = (p.reserve_b / p.reserve_a) if p.reserve_a and p.reserve_b else None
-        else:
-            price = (p.reserve_a / p.reserve_b) if p.reserve_a and p.reserve_b else None
-        trending.append({
-            "symbol": tok.symbol,
-            "name": tok.name,
-            "price": float(price) if price is not None else None,
-            "volume_24h": float(vol or 0),
-        })
-    trending.sort(key=lambda x: x["volume_24h"], reverse=True)
-    trending = trending[:6]
+    # Trending by AMM 24h volume (gUSD pairs): top six of the shared cached homepage list
+    flush_trade_caches()
+    trending = [
+        {k: it[k] for k in ("symbol", "name", "price", "volume_24h")}
+        for it in cached_trending_items()[:6]
+    ]
 
     return render_template("dashboard.html", user=user, wl_count=wl_count, alerts_count=alerts_count, trending=trending)
 
@@ -646,11 +659,7 @@ def dashboard():
 @users_bp.route("/portfolio")
 @require_auth_web
 def portfolio():
-    payload = g.jwt_payload
-    uid = payload.get("uid")
-    user = None
-    if isinstance(uid, int):
-        user = db.session.get(User, uid)
+    user = current_user()
     tokens = (
         Token.query.order_by(
             case((Token.market_cap == None, 1), else_=0),  # noqa: E711
@@ -658,7 +667,7 @@ def portfolio():
         ).limit(4).all()
     )
     holdings = [{"token": t, "amount": 0.0, "value": 0.0} for t in tokens]
-    price_by_symbol = {t.symbol: (_amm_price_for_token(t) or float(t.price or 0)) for t in tokens if t and t.symbol}
+    price_by_symbol = _price_by_symbol(tokens)
     return render_template(
         "portfolio.html",
         user=user,
@@ -671,13 +680,32 @@ def portfolio():
 
 
 # Twitter connection API endpoints
+def _get_or_create_twitter_user(filters: dict, **values) -> TwitterUser:
+    """Find a TwitterUser (with its connection loaded) or insert it.
+
+    The insert runs in a savepoint, so a concurrent request that created the same account first
+    trips the unique key and is re-read instead of failing the whole request.
+    """
+    query = TwitterUser.query.options(joinedload(TwitterUser.user_connection)).filter_by(**filters)
+    twitter_user = query.first()
+    if twitter_user:
+        return twitter_user
+    try:
+        with db.session.begin_nested():
+            twitter_user = TwitterUser(**filters, **values)
+            db.session.add(twitter_user)
+    except IntegrityError:
+        twitter_user = query.first()
+        if not twitter_user:
+            raise
+    return twitter_user
+
+
 @users_bp.route("/api/connect-twitter", methods=["POST"])
 @require_auth_web
 def connect_twitter():
     """Connect Twitter account to user profile"""
-    payload = g.jwt_payload
-    uid = payload.get("uid")
-    user = db.session.get(User, uid) if isinstance(uid, int) else None
+    user = current_user()
     if not user:
         return jsonify({"success": False, "error": "User not found"}), 404
 
@@ -694,16 +722,11 @@ def connect_twitter():
         return jsonify({"success": False, "error": "Twitter account already connected"}), 400
 
     # Find or create Twitter user
-    twitter_user = TwitterUser.query.filter_by(username=username).first()
-    if not twitter_user:
-        # Create new Twitter user record
-        twitter_user = TwitterUser(
-            username=username,
-            display_name=username,
-            created_at=datetime.utcnow()
-        )
-        db.session.add(twitter_user)
-        db.session.flush()  # Get ID
+    twitter_user = _get_or_create_twitter_user(
+        {"username": username},
+        display_name=username,
+        created_at=datetime.utcnow()
+    )
 
     # Check if Twitter user is already connected to another user
     if twitter_user.user_connection:
@@ -734,9 +757,7 @@ def connect_twitter():
 @require_auth_web
 def disconnect_twitter():
     """Disconnect Twitter account from user profile"""
-    payload = g.jwt_payload
-    uid = payload.get("uid")
-    user = db.session.get(User, uid) if isinstance(uid, int) else None
+    user = current_user()
     if not user:
         return jsonify({"success": False, "error": "User not found"}), 404
 
@@ -763,6 +784,11 @@ TWITTER_AUTH_URL = "https://twitter.com/i/oauth2/authorize"
 TWITTER_TOKEN_URL = "https://api.twitter.com/2/oauth2/token"
 TWITTER_SCOPES = ["tweet.read", "users.read", "offline.access"]
 
+# Keep-alive connection pool shared by every Twitter call, so OAuth callbacks skip the TLS handshake
+_twitter_adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20)
+_twitter_http = requests.Session()
+_twitter_http.mount("https://", _twitter_adapter)
+
 def generate_pkce_codes():
     """Generate PKCE code verifier and challenge"""
     # Generate code verifier (43-128 characters)
@@ -793,11 +819,13 @@ def get_twitter_oauth():
     if not current_app.debug and not redirect_uri.startswith('https://'):
         redirect_uri = redirect_uri.replace('http://', 'https://', 1)
 
-    return OAuth2Session(
+    oauth = OAuth2Session(
         client_id=TWITTER_CLIENT_ID,
         scope=TWITTER_SCOPES,
         redirect_uri=redirect_uri
     )
+    oauth.mount("https://", _twitter_adapter)
+    return oauth
 
 
 # Twitter OAuth2 authentication routes
@@ -805,9 +833,7 @@ def get_twitter_oauth():
 @require_auth_web
 def twitter_auth():
     """Initiate Twitter OAuth2 authentication"""
-    payload = g.jwt_payload
-    uid = payload.get("uid")
-    user = db.session.get(User, uid) if isinstance(uid, int) else None
+    user = current_user()
     if not user:
         flash("You must be logged in to connect Twitter", "error")
         return redirect(url_for("web.main.home"))
@@ -853,9 +879,7 @@ def twitter_auth():
 @require_auth_web
 def twitter_callback():
     """Handle Twitter OAuth2 callback"""
-    payload = g.jwt_payload
-    uid = payload.get("uid")
-    user = db.session.get(User, uid) if isinstance(uid, int) else None
+    user = current_user()
     if not user:
         flash("Authentication required", "error")
         return redirect(url_for("web.main.home"))
@@ -902,7 +926,7 @@ def twitter_callback():
 
         # Use Basic Authentication for client credentials
         auth = (TWITTER_CLIENT_ID, current_app.config.get('TWITTER_CLIENT_SECRET'))
-        token_response = requests.post(TWITTER_TOKEN_URL, data=token_data, auth=auth)
+        token_response = _twitter_http.post(TWITTER_TOKEN_URL, data=token_data, auth=auth)
         if token_response.status_code != 200:
             current_app.logger.error(f"Token exchange failed: {token_response.status_code}")
             current_app.logger.error(f"Response: {token_response.text}")
@@ -918,7 +942,7 @@ def twitter_callback():
             'Authorization': f'Bearer {token["access_token"]}',
             'Content-Type': 'application/json'
         }
-        user_response = requests.get(
+        user_response = _twitter_http.get(
             "https://api.twitter.com/2/users/me",
             headers=headers,
             params={"user.fields": "public_metrics,profile_image_url,verified,description"}
@@ -938,23 +962,18 @@ def twitter_callback():
             return redirect(url_for("web.users.user_profile"))
 
         # Find or create Twitter user record
-        twitter_user = TwitterUser.query.filter_by(twitter_user_id=twitter_user_id).first()
-
-        if not twitter_user:
-            twitter_user = TwitterUser(
-                twitter_user_id=twitter_user_id,
-                username=username,
-                display_name=display_name,
-                description=twitter_user_data.get('description'),
-                profile_image_url=twitter_user_data.get('profile_image_url'),
-                verified=twitter_user_data.get('verified', False),
-                followers_count=twitter_user_data.get('public_metrics', {}).get('followers_count', 0),
-                following_count=twitter_user_data.get('public_metrics', {}).get('following_count', 0),
-                tweet_count=twitter_user_data.get('public_metrics', {}).get('tweet_count', 0),
-                created_at=datetime.utcnow()
-            )
-            db.session.add(twitter_user)
-            db.session.flush()
+        twitter_user = _get_or_create_twitter_user(
+            {"twitter_user_id": twitter_user_id},
+            username=username,
+            display_name=display_name,
+            description=twitter_user_data.get('description'),
+            profile_image_url=twitter_user_data.get('profile_image_url'),
+            verified=twitter_user_data.get('verified', False),
+            followers_count=twitter_user_data.get('public_metrics', {}).get('followers_count', 0),
+            following_count=twitter_user_data.get('public_metrics', {}).get('following_count', 0),
+            tweet_count=twitter_user_data.get('public_metrics', {}).get('tweet_count', 0),
+            created_at=datetime.utcnow()
+        )
 
         # Check if Twitter user is already connected to another user
         if twitter_user.user_connection and twitter_user.user_connection.user_id != user.id:
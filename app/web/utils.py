@@ -10,69 +10,123 @@ from app.models import (
     TokenInfo,
     SwapPool,
     SwapTrade,
+    fee_bps_for,
 )
-from sqlalchemy import case, func
+from sqlalchemy import Float, case, cast, func, or_
+
+
+@cache.memoize(timeout=300)
+def _get_gusd_token_id_cached() -> Optional[int]:
+    # "GUSD" wins over "gUSD" if both exist; None is not cached, so a later-created gUSD is picked up
+    return (
+        db.session.query(Token.id)
+        .filter(Token.symbol.in_(("GUSD", "gUSD")))
+        .order_by(case((Token.symbol == "GUSD", 0), else_=1))
+        .limit(1)
+        .scalar()
+    )
 
 
 def get_gusd_token() -> Optional[Token]:
-    return Token.query.filter_by(symbol="GUSD").first() or Token.query.filter_by(symbol="gUSD").first()
+    gusd_id = _get_gusd_token_id_cached()
+    return db.session.get(Token, gusd_id) if gusd_id else None
 
 
-def amm_price_for_token(token: Token) -> Optional[float]:
-    """Compute AMM price for token against gUSD if such a pool exists."""
-    gusd = get_gusd_token()
-    if not gusd:
-        return None
-    pool = (
+def amm_prices_for_tokens(token_ids) -> dict:
+    """Batch AMM prices against gUSD for many tokens in one pool query: {token_id: price}."""
+    gusd_id = _get_gusd_token_id_cached()
+    ids = {tid for tid in token_ids if tid is not None}
+    if not gusd_id or not ids:
+        return {}
+    rows = (
         SwapPool.query.filter(
-            ((SwapPool.token_a_id == token.id) & (SwapPool.token_b_id == gusd.id))
-            | ((SwapPool.token_b_id == token.id) & (SwapPool.token_a_id == gusd.id))
-        ).first()
+            (SwapPool.token_a_id.in_(ids) & (SwapPool.token_b_id == gusd_id))
+            | (SwapPool.token_b_id.in_(ids) & (SwapPool.token_a_id == gusd_id))
+        )
+        .with_entities(
+            SwapPool.token_a_id,
+            SwapPool.token_b_id,
+            # Reserves come back as floats so the price is one FP division, not Decimal math
+            cast(SwapPool.reserve_a, Float),
+            cast(SwapPool.reserve_b, Float),
+        )
+        .all()
     )
-    if not pool or not pool.reserve_a or not pool.reserve_b:
-        return None
-    try:
-        if pool.token_b_id == gusd.id:
-            pr = (pool.reserve_b / pool.reserve_a)
-        elif pool.token_a_id == gusd.id:
-            pr = (pool.reserve_a / pool.reserve_b)
+    prices = {}
+    for token_a_id, token_b_id, reserve_a, reserve_b in rows:
+        if not reserve_a or not reserve_b:
+            continue
+        if token_b_id == gusd_id:
+            prices.setdefault(token_a_id, reserve_b / reserve_a)
         else:
-            pr = None
-        return float(pr) if pr is not None else None
-    except Exception:
+            prices.setdefault(token_b_id, reserve_a / reserve_b)
+    return prices
+
+
+def amm_price_for_token(token: Token) -> Optional[float]:
+    """Compute AMM price for token against gUSD if such a pool exists."""
+    if token is None or token.id is None:
         return None
+    return amm_prices_for_tokens((token.id,)).get(token.id)
 
 
 @cache.memoize(timeout=30)
 def cached_trending_items():
     from datetime import timedelta as _td
     since = datetime.utcnow() - _td(days=1)
-    gusd = get_gusd_token()
-    pools = SwapPool.query.order_by(SwapPool.id.asc()).all()
+    gusd_id = _get_gusd_token_id_cached()
     trending = []
-    for p in pools:
-        if not gusd or (p.token_a_id != gusd.id and p.token_b_id != gusd.id):
-            continue
-        vol = (
-            db.session.query(SwapTrade)
-            .filter(SwapTrade.pool_id == p.id, SwapTrade.created_at >= since)
-            .with_entities(db.func.coalesce(db.func.sum(SwapTrade.amount_in), 0))
-            .scalar()
+    if not gusd_id:
+        return trending
+    # Column rows instead of SwapPool instances: only what the loop below reads
+    pools = (
+        db.session.query(
+            SwapPool.id,
+            SwapPool.token_a_id,
+            SwapPool.token_b_id,
+            SwapPool.reserve_a,
+            SwapPool.reserve_b,
+            SwapPool.fee_bps_base,
+            SwapPool.stage,
+            SwapPool.cumulative_volume_a,
+            SwapPool.stage1_threshold,
+            SwapPool.stage2_threshold,
+            SwapPool.stage3_threshold,
         )
-        token_id = p.token_a_id if p.token_b_id == gusd.id else p.token_b_id
-        tok = db.session.get(Token, token_id)
+        .filter((SwapPool.token_a_id == gusd_id) | (SwapPool.token_b_id == gusd_id))
+        .order_by(SwapPool.id.asc())
+        .all()
+    )
+    if not pools:
+        return trending
+    # 24h volume for every pool in one GROUP BY, paired tokens in one IN query
+    vols = dict(
+        db.session.query(SwapTrade.pool_id, func.coalesce(func.sum(SwapTrade.amount_in), 0))
+        .filter(SwapTrade.created_at >= since, SwapTrade.pool_id.in_([p.id for p in pools]))
+        .group_by(SwapTrade.pool_id)
+        .all()
+    )
+    token_ids = {p.token_a_id if p.token_b_id == gusd_id else p.token_b_id for p in pools}
+    tokens_by_id = {
+        t.id: t
+        for t in Token.query.filter(Token.id.in_(token_ids)).with_entities(Token.id, Token.symbol, Token.name)
+    }
+    for p in pools:
+        vol = vols.get(p.id, 0)
+        token_id = p.token_a_id if p.token_b_id == gusd_id else p.token_b_id
+        tok = tokens_by_id.get(token_id)
         if not tok:
             continue
-        if p.token_b_id == gusd.id:
+        if p.token_b_id == gusd_id:
             price = (p.reserve_b / p.reserve_a) if p.reserve_a and p.reserve_b else None
         else:
             price = (p.reserve_a / p.reserve_b) if p.reserve_a and p.reserve_b else None
         # stage progress
         stg = int(p.stage or 1)
         vol_a = float(p.cumulative_volume_a or 0)
-        thr1 = float(p.stage1_threshold) if getattr(p, "stage1_threshold", None) is not None else None
-        thr2 = float(p.stage2_threshold) if getattr(p, "stage2_threshold", None) is not None else None
-        thr3 = float(p.stage3_threshold) if getattr(p, "stage3_threshold", None) is not None else None
+        thr1 = float(p.stage1_threshold) if p.stage1_threshold is not None else None
+        thr2 = float(p.stage2_threshold) if p.stage2_threshold is not None else None
+        thr3 = float(p.stage3_threshold) if p.stage3_threshold is not None else None
         next_thr = None
         if stg < 2:
             next_thr = thr1
@@ -87,7 +141,7 @@ def cached_trending_items():
             "price": float(price) if price is not None else None,
             "volume_24h": float(vol or 0),
             "stage": int(p.stage or 1),
-            "fee_bps": p.current_fee_bps(),
+            "fee_bps": fee_bps_for(p.stage, p.fee_bps_base),
             "next_stage": (stg + 1) if next_thr else None,
             "progress_pct": progress_pct,
             "remaining_to_next": (float(next_thr) - vol_a) if next_thr else 0.0,
@@ -99,16 +153,18 @@ def cached_trending_items():
 @cache.memoize(timeout=60)
 def cached_recent_launches():
     recent_launches = []
-    infos = (
-        TokenInfo.query.order_by(TokenInfo.launch_at.desc()).limit(12).all()
+    # Launch rows and their tokens in one join (inner join drops infos whose token is gone)
+    rows = (
+        db.session.query(TokenInfo.logo_url, TokenInfo.launch_at, Token.symbol, Token.name)
+        .join(Token, Token.id == TokenInfo.token_id)
+        .order_by(TokenInfo.launch_at.desc())
+        .limit(12)
+        .all()
     )
-    for info in infos:
-        tok = db.session.get(Token, info.token_id)
-        if not tok:
-            continue
+    for info in rows:
         recent_launches.append({
-            "symbol": tok.symbol,
-            "name": tok.name,
+            "symbol": info.symbol,
+            "name": info.name,
             "logo_url": info.logo_url,
             "launch_at": info.launch_at.isoformat() + "Z" if info.launch_at else None,
         })
@@ -118,21 +174,19 @@ def cached_recent_launches():
 @cache.memoize(timeout=120)
 def cached_top_creators():
     top_creators = []
+    # Launch counts grouped together with the user columns the list shows: one query, no per-user get
     agg = (
-        db.session.query(TokenInfo.launch_user_id, db.func.count(TokenInfo.id).label("cnt"))
-        .filter(TokenInfo.launch_user_id != None)  # noqa: E711
-        .group_by(TokenInfo.launch_user_id)
+        db.session.query(User.id, User.npub, User.pubkey_hex, db.func.count(TokenInfo.id).label("cnt"))
+        .join(User, User.id == TokenInfo.launch_user_id)
+        .group_by(User.id, User.npub, User.pubkey_hex)
         .order_by(db.text("cnt DESC"))
         .limit(5)
         .all()
     )
-    for uid, cnt in agg:
-        u = db.session.get(User, uid)
-        if not u:
-            continue
+    for uid, npub, pubkey_hex, cnt in agg:
         top_creators.append({
-            "user_id": u.id,
-            "npub": u.npub or u.pubkey_hex,
+            "user_id": uid,
+            "npub": npub or pubkey_hex,
             "count": int(cnt or 0),
         })
     return top_creators
@@ -150,40 +204,33 @@ def cached_stats():
     since_24h = datetime.utcnow() - timedelta(days=1)
     trades_24h = 0
     volume_24h_gusd = 0.0
-    gusd = get_gusd_token()
-    if gusd:
-        pools_gusd = SwapPool.query.filter(
-            (SwapPool.token_a_id == gusd.id) | (SwapPool.token_b_id == gusd.id)
-        ).all()
-        pool_ids = [p.id for p in pools_gusd]
-        if pool_ids:
-            rows = (
-                SwapTrade.query
-                .filter(SwapTrade.pool_id.in_(pool_ids), SwapTrade.created_at >= since_24h)
-                .order_by(SwapTrade.created_at.desc())
-                .all()
+    gusd_id = _get_gusd_token_id_cached()
+    if gusd_id:
+        # gUSD leg of each trade: amount_out when selling into a gUSD token_b (or buying from a
+        # gUSD token_a), amount_in otherwise; SUM skips the NULL amounts the old loop skipped
+        gusd_leg = case(
+            (
+                SwapPool.token_b_id == gusd_id,
+                case((SwapTrade.side == "AtoB", SwapTrade.amount_out), else_=SwapTrade.amount_in),
+            ),
+            else_=case((SwapTrade.side == "AtoB", SwapTrade.amount_in), else_=SwapTrade.amount_out),
+        )
+        trades_24h, volume_24h_gusd = (
+            db.session.query(func.count(SwapTrade.id), func.coalesce(func.sum(gusd_leg), 0))
+            .join(SwapPool, SwapPool.id == SwapTrade.pool_id)
+            .filter(
+                SwapTrade.created_at >= since_24h,
+                or_(SwapPool.token_a_id == gusd_id, SwapPool.token_b_id == gusd_id),
             )
-            trades_24h = len(rows)
-            for t in rows:
-                pool = next((p for p in pools_gusd if p.id == t.pool_id), None)
-                if not pool:
-                    continue
-                if pool.token_b_id == gusd.id:
-                    if t.side == "AtoB":
-                        if t.amount_out:
-                            volume_24h_gusd += float(t.amount_out)
-                    else:
-                        if t.amount_in:
-                            volume_24h_gusd += float(t.amount_in)
-                elif pool.token_a_id == gusd.id:
-                    if t.side == "AtoB":
-                        if t.amount_in:
-                            volume_24h_gusd += float(t.amount_in)
-                    else:
-                        if t.amount_out:
-                            volume_24h_gusd += float(t.amount_out)
+            .one()
+        )
     else:
-        trades_24h = SwapTrade.query.filter(SwapTrade.created_at >= since_24h).count()
+        # Plain COUNT over the ix_swap_trades_created range; Query.count() would wrap it in a subquery
+        trades_24h = (
+            db.session.query(func.count(SwapTrade.id))
+            .filter(SwapTrade.created_at >= since_24h)
+            .scalar()
+        )
     return {
         "tokens": int(tokens_count or 0),
         "pools": int(pools_count or 0),
@@ -192,3 +239,39 @@ def cached_stats():
         "volume_24h": float(volume_24h_gusd or 0.0),
     }
 
+
+@cache.memoize(timeout=30)
+def cached_homepage_sections() -> dict:
+    """Trending, launches, creators and stats for the home page behind a single cache key."""
+    return {
+        "trending": cached_trending_items(),
+        "recent_launches": cached_recent_launches(),
+        "top_creators": cached_top_creators(),
+        "stats": cached_stats(),
+    }
+
+
+# Trades mark the trade-derived builders dirty; the builders are cleared at most once per cooldown
+# window, right away or by the first read after the window closes, so a burst's last trade still shows.
+TRADE_CACHES_DIRTY_KEY = "trending_dirty"
+TRADE_CACHE_COOLDOWN_KEY = "trade_caches_invalidated"
+TRADE_CACHE_COOLDOWN_SECONDS = 5
+
+
+def flush_trade_caches() -> None:
+    """Clear the trending/stats/home builders if a trade dirtied them and the cooldown has ended."""
+    if not cache.get(TRADE_CACHES_DIRTY_KEY):
+        return
+    if not cache.add(TRADE_CACHE_COOLDOWN_KEY, 1, timeout=TRADE_CACHE_COOLDOWN_SECONDS):
+        return
+    # Clear the flag before the builders, so a trade landing in between leaves it set for next time
+    cache.delete(TRADE_CACHES_DIRTY_KEY)
+    cache.delete_memoized(cached_trending_items)
+    cache.delete_memoized(cached_stats)
+    cache.delete_memoized(cached_homepage_sections)
+
+
+def mark_trade_caches_dirty() -> None:
+    """Record that a trade committed; flushes immediately unless a flush ran within the cooldown."""
+    cache.set(TRADE_CACHES_DIRTY_KEY, 1, timeout=0)
+    flush_trade_caches()
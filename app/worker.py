@@ -2,6 +2,7 @@ import os
 import time
 from datetime import datetime, timedelta
 
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
 
 from app import create_app
@@ -93,7 +94,13 @@ if __name__ == "__main__":
     hb_interval = int(os.getenv("WORKER_INTERVAL_SECONDS", "30"))
     refresh_interval = int(os.getenv("MARKET_REFRESH_SECONDS", "30"))
     lightning_check_interval = int(os.getenv("LIGHTNING_CHECK_INTERVAL_SECONDS", "30"))
-    scheduler = BackgroundScheduler()
+    worker_threads = int(os.getenv("WORKER_THREADS", "4"))
+    # Price refresh and LNbits polls overlap on their own threads; each job still runs one
+    # instance at a time, and runs missed while busy collapse into one if within 30s
+    scheduler = BackgroundScheduler(
+        executors={"default": ThreadPoolExecutor(worker_threads)},
+        job_defaults={"coalesce": True, "max_instances": 1, "misfire_grace_time": 30},
+    )
     scheduler.add_job(heartbeat_job, "interval", seconds=hb_interval, id="heartbeat")
     scheduler.add_job(refresh_prices_job, "interval", seconds=refresh_interval, id="refresh_prices")
     scheduler.add_job(check_lightning_payments_job, "interval", seconds=lightning_check_interval, id="check_lightning_payments")
@@ -0,0 +1,36 @@
+"""per-user holdings and lightning activity indexes
+
+Revision ID: a1b2c3d4e5f6
+Revises: f0a1b2c3d4e5
+Create Date: 2025-10-12 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a1b2c3d4e5f6'
+down_revision = 'f0a1b2c3d4e5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # swap_trades (user_id) and (pool_id, created_at) and fee_payouts (pool_id, entity, asset, created_at)
+    # already exist; creator_follows was dropped in drop_unused_tables_001
+    with op.batch_alter_table('token_balances', schema=None) as batch_op:
+        batch_op.create_index('ix_token_balances_user_amount', ['user_id', 'amount'], unique=False)
+    with op.batch_alter_table('lightning_invoices', schema=None) as batch_op:
+        batch_op.create_index('ix_lightning_invoices_user_created', ['user_id', 'created_at'], unique=False)
+    with op.batch_alter_table('lightning_withdrawals', schema=None) as batch_op:
+        batch_op.create_index('ix_lightning_withdrawals_user_created', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('lightning_withdrawals', schema=None) as batch_op:
+        batch_op.drop_index('ix_lightning_withdrawals_user_created')
+    with op.batch_alter_table('lightning_invoices', schema=None) as batch_op:
+        batch_op.drop_index('ix_lightning_invoices_user_created')
+    with op.batch_alter_table('token_balances', schema=None) as batch_op:
+        batch_op.drop_index('ix_token_balances_user_amount')
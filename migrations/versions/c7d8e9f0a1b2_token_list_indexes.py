@@ -0,0 +1,32 @@
+"""token list indexes
+
+Revision ID: c7d8e9f0a1b2
+Revises: drop_unused_tables_001
+Create Date: 2025-10-08 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c7d8e9f0a1b2'
+down_revision = 'drop_unused_tables_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tokens', schema=None) as batch_op:
+        batch_op.create_index('ix_tokens_hidden_market_cap', ['hidden', 'market_cap'], unique=False)
+
+    with op.batch_alter_table('token_infos', schema=None) as batch_op:
+        batch_op.create_index('ix_token_infos_moderation_token', ['moderation_status', 'token_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('token_infos', schema=None) as batch_op:
+        batch_op.drop_index('ix_token_infos_moderation_token')
+
+    with op.batch_alter_table('tokens', schema=None) as batch_op:
+        batch_op.drop_index('ix_tokens_hidden_market_cap')
@@ -0,0 +1,26 @@
+"""token price index
+
+Revision ID: d8e9f0a1b2c3
+Revises: c7d8e9f0a1b2
+Create Date: 2025-10-09 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8e9f0a1b2c3'
+down_revision = 'c7d8e9f0a1b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tokens', schema=None) as batch_op:
+        batch_op.create_index('ix_tokens_price', ['price'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tokens', schema=None) as batch_op:
+        batch_op.drop_index('ix_tokens_price')
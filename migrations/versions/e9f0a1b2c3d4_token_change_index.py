@@ -0,0 +1,26 @@
+"""token hidden/change_24h index
+
+Revision ID: e9f0a1b2c3d4
+Revises: d8e9f0a1b2c3
+Create Date: 2025-10-10 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9f0a1b2c3d4'
+down_revision = 'd8e9f0a1b2c3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('tokens', schema=None) as batch_op:
+        batch_op.create_index('ix_tokens_hidden_change_24h', ['hidden', 'change_24h'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('tokens', schema=None) as batch_op:
+        batch_op.drop_index('ix_tokens_hidden_change_24h')
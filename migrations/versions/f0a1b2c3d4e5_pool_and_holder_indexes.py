@@ -0,0 +1,31 @@
+"""swap pool pair and token holder indexes
+
+Revision ID: f0a1b2c3d4e5
+Revises: e9f0a1b2c3d4
+Create Date: 2025-10-11 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f0a1b2c3d4e5'
+down_revision = 'e9f0a1b2c3d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # swap_trades (pool_id, created_at) and (created_at) already exist from a9c1e5b9278a
+    with op.batch_alter_table('token_balances', schema=None) as batch_op:
+        batch_op.create_index('ix_token_balances_token_amount', ['token_id', 'amount'], unique=False)
+    with op.batch_alter_table('swap_pools', schema=None) as batch_op:
+        batch_op.create_index('ix_swap_pools_tokens', ['token_a_id', 'token_b_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('swap_pools', schema=None) as batch_op:
+        batch_op.drop_index('ix_swap_pools_tokens')
+    with op.batch_alter_table('token_balances', schema=None) as batch_op:
+        batch_op.drop_index('ix_token_balances_token_amount')
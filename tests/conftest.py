@@ -0,0 +1,18 @@
+import pytest
+
+from app import create_app
+from app.config import Config
+
+
+@pytest.fixture()
+def app(tmp_path):
+    class TestConfig(Config):
+        TESTING = True
+        SQLALCHEMY_DATABASE_URI = f"sqlite:///{tmp_path / 'test.db'}"
+
+    return create_app(TestConfig)
+
+
+@pytest.fixture()
+def client(app):
+    return app.test_client()
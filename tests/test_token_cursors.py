@@ -0,0 +1,37 @@
+import base64
+import json
+
+import pytest
+
+
+def _cursor(value, token_id) -> str:
+    raw = json.dumps([value, token_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+@pytest.mark.parametrize(
+    "path, sort, value, token_id",
+    [
+        ("/tokens/", "price", "Tok, 3", 5),
+        ("/tokens/explore", "market_cap", "abc", 5),
+        ("/tokens/", "name", [1], 2),
+        ("/tokens/", "price", "NaN", 5),
+        ("/tokens/", "price", True, 5),
+        ("/tokens/", "symbol", 7, 5),
+        ("/tokens/", "price", "1.5", "x"),
+    ],
+)
+def test_bad_cursor_falls_back_to_offset_paging(client, path, sort, value, token_id):
+    resp = client.get(path, query_string={"sort": sort, "after": _cursor(value, token_id)})
+    assert resp.status_code == 200
+
+
+def test_garbage_cursor_is_ignored(client):
+    resp = client.get("/tokens/", query_string={"sort": "price", "after": "not-base64!!"})
+    assert resp.status_code == 200
+
+
+@pytest.mark.parametrize("sort, value", [("price", "0.5"), ("market_cap", 1000), ("name", "M"), ("price", None)])
+def test_valid_cursor_still_seeks(client, sort, value):
+    resp = client.get("/tokens/", query_string={"sort": sort, "after": _cursor(value, 1)})
+    assert resp.status_code == 200
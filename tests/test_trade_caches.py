@@ -0,0 +1,36 @@
+from app.extensions import cache, db
+from app.models import Token
+from app.web.utils import (
+    TRADE_CACHE_COOLDOWN_KEY,
+    cached_stats,
+    flush_trade_caches,
+    mark_trade_caches_dirty,
+)
+
+
+def _add_token(symbol: str) -> None:
+    db.session.add(Token(symbol=symbol, name=symbol))
+    db.session.commit()
+
+
+def test_trade_inside_cooldown_is_flushed_after_it(app):
+    with app.app_context():
+        mark_trade_caches_dirty()  # first trade of the burst flushes and starts the cooldown
+        before = cached_stats()["tokens"]
+
+        _add_token("BURST")
+        mark_trade_caches_dirty()  # inside the cooldown: only marks the builders dirty
+        flush_trade_caches()
+        assert cached_stats()["tokens"] == before
+
+        cache.delete(TRADE_CACHE_COOLDOWN_KEY)  # cooldown window ends
+        flush_trade_caches()
+        assert cached_stats()["tokens"] == before + 1
+
+
+def test_flush_without_trades_keeps_the_cache(app):
+    with app.app_context():
+        before = cached_stats()["tokens"]
+        _add_token("QUIET")
+        flush_trade_caches()
+        assert cached_stats()["tokens"] == before
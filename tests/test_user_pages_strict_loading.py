@@ -0,0 +1,35 @@
+from decimal import Decimal
+
+import pytest
+
+from app.extensions import db
+from app.models import Token, TokenBalance, TwitterUser, User, UserTwitterConnection
+from app.utils.jwt_utils import create_jwt
+
+NPUB = "npub1strictloadingfixture"
+
+
+@pytest.fixture()
+def debug_client(app):
+    # Debug turns on raiseload('*') in the user pages, so any unplanned lazy load raises
+    app.debug = True
+    with app.app_context():
+        user = User(pubkey_hex="cd" * 32, npub=NPUB, display_name="Fixture")
+        twitter_user = TwitterUser(twitter_user_id=424242, username="fixture_user", display_name="Fixture")
+        db.session.add_all([user, twitter_user])
+        db.session.flush()
+        db.session.add(UserTwitterConnection(user_id=user.id, twitter_user_id=twitter_user.id, verified=True))
+        token = Token.query.filter_by(symbol="PFUN").first()
+        db.session.add(TokenBalance(user_id=user.id, token_id=token.id, amount=Decimal("12.5")))
+        db.session.commit()
+        jwt_token = create_jwt({"uid": user.id, "sub": user.pubkey_hex})
+    client = app.test_client()
+    client.set_cookie("pf_jwt", jwt_token)
+    return client
+
+
+@pytest.mark.parametrize("path", ["/users/profile", "/users/wallet", f"/users/{NPUB}", "/users/@fixture_user"])
+def test_user_pages_render_without_lazy_loads(debug_client, path):
+    # TESTING propagates view exceptions, so a raiseload InvalidRequestError fails here
+    resp = debug_client.get(path)
+    assert resp.status_code == 200
@@ -0,0 +1,29 @@
+from app.extensions import db
+from app.models import Token, TokenInfo
+from app.web.tokens.routes import _visible_tokens
+
+
+def _token(symbol: str, hidden: bool = False, moderation_status=None) -> None:
+    token = Token(symbol=symbol, name=symbol, hidden=hidden)
+    db.session.add(token)
+    db.session.flush()
+    if moderation_status:
+        db.session.add(TokenInfo(token_id=token.id, moderation_status=moderation_status))
+
+
+def test_visible_tokens_query_builds_and_filters(app):
+    with app.app_context():
+        _token("SHOWN")
+        _token("SHOWNINFO", moderation_status="visible")
+        _token("FLAGGED", moderation_status="flagged")
+        _token("HIDDEN", hidden=True)
+        _token("MODHIDDEN", moderation_status="hidden")
+        db.session.commit()
+
+        qry = _visible_tokens(Token.query)
+        # Building the statement is where a bad join or column would fail; do it once, outside any try
+        assert "token_infos" in str(qry.statement.compile())
+
+        symbols = {t.symbol for t in qry.all()}
+        assert {"SHOWN", "SHOWNINFO", "FLAGGED"} <= symbols
+        assert not {"HIDDEN", "MODHIDDEN"} & symbols